@@ -1,58 +1,113 @@
 """
 AI News Agent using LangChain 1.0 create_agent API.
 """
-from datetime import datetime
+import sqlite3
+from datetime import date, datetime
 from pathlib import Path
 from langchain.agents import create_agent
+from langchain.agents.middleware import dynamic_prompt
 from langchain_google_genai import ChatGoogleGenerativeAI
+from langgraph.checkpoint.sqlite import SqliteSaver
 from config import Config
+from freshness import FreshnessFilter
+from hedging import HedgedModelMiddleware
+from run_ids import new_run_id
 from tools import get_all_tools
 
 
 class AINewsAgent:
     """AI Agent for researching and summarizing AI and automation news."""
     
-    def __init__(self):
-        """Initialize the AI News Agent with Gemini model and tools."""
+    def __init__(self, checkpoint_path: str = None):
+        """
+        Initialize the AI News Agent with Gemini model and tools.
+        
+        Args:
+            checkpoint_path (str): Optional path of the SQLite checkpoint store.
+        """
         self.model = self._initialize_model()
-        self.tools = get_all_tools()
+        self.hedging = self._initialize_hedging()
+        self.freshness = FreshnessFilter(Config.FRESHNESS_WINDOW_HOURS)
+        self.tools = get_all_tools(self.freshness)
+        self.checkpointer = self._initialize_checkpointer(checkpoint_path)
         self.agent = self._create_agent()
+        self.run_id = None
     
-    def _initialize_model(self):
+    def _initialize_model(self, model_name: str = None):
         """
         Initialize the Gemini model.
         
+        Args:
+            model_name (str): Optional model name, defaults to Config.MODEL_NAME.
+        
         Returns:
             ChatGoogleGenerativeAI: Configured Gemini model.
         """
         model = ChatGoogleGenerativeAI(
-            model=Config.MODEL_NAME,
+            model=model_name or Config.MODEL_NAME,
             google_api_key=Config.GOOGLE_API_KEY,
             temperature=0.7,
+            timeout=Config.MODEL_TIMEOUT_SECONDS,
             convert_system_message_to_human=True
         )
         return model
     
+    def _initialize_hedging(self):
+        """
+        Initialize the deadline, hedging and fallback policy for model calls.
+        
+        Returns:
+            HedgedModelMiddleware: Middleware wrapping every model call.
+        """
+        fallback_models = [
+            self._initialize_model(model_name)
+            for model_name in Config.FALLBACK_MODEL_NAMES
+        ]
+        return HedgedModelMiddleware(
+            fallback_models=fallback_models,
+            timeout=Config.MODEL_TIMEOUT_SECONDS,
+            hedge_after=Config.MODEL_HEDGE_AFTER_SECONDS
+        )
+    
+    def _initialize_checkpointer(self, checkpoint_path: str = None):
+        """
+        Open the durable store where agent steps are checkpointed.
+        
+        Args:
+            checkpoint_path (str): Optional path of the SQLite database.
+            
+        Returns:
+            SqliteSaver: Checkpointer persisting messages and tool results.
+        """
+        path = Path(checkpoint_path or Config.CHECKPOINT_DB)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(path), check_same_thread=False)
+        return SqliteSaver(connection)
+    
     def _create_agent(self):
         """
         Create the LangChain agent using the create_agent API.
         
+        The system prompt holds today's date, so it is built for every model
+        call rather than once: a warm agent may serve runs for days.
+        
         Returns:
             Agent: Configured LangChain agent.
         """
-        system_prompt = self._get_system_prompt()
+        system_prompt = dynamic_prompt(lambda request: self._get_system_prompt())
         
         agent = create_agent(
             model=self.model,
             tools=self.tools,
-            system_prompt=system_prompt
+            middleware=[system_prompt, self.hedging],
+            checkpointer=self.checkpointer
         )
         
         return agent
     
     def _get_system_prompt(self) -> str:
         """
-        Get the fixed system prompt for the agent.
+        Get the system prompt for the agent, dated today.
         
         Returns:
             str: System prompt for the agent.
@@ -130,14 +185,71 @@ Begin your research and create today's news report."""
         
         return queries
     
-    def research_and_generate_report(self) -> str:
+    def _latest_unfinished_run_id(self):
+        """
+        Find the latest run checkpointed today that still has steps to run.
+        
+        Completed runs and runs from earlier days are never picked, so an
+        automatic resume cannot deliver an old report.
+        
+        Returns:
+            str: Run ID of the unfinished run, or None if there is none.
+        """
+        # Checkpoints are listed newest first, across every run. The listing
+        # holds the store's lock, so states are only read once it is done.
+        run_ids = []
+        for checkpoint in self.checkpointer.list(None):
+            checkpointed_at = datetime.fromisoformat(checkpoint.checkpoint["ts"]).astimezone()
+            if checkpointed_at.date() < date.today():
+                break
+            run_id = checkpoint.config["configurable"]["thread_id"]
+            if run_id not in run_ids:
+                run_ids.append(run_id)
+        
+        for run_id in run_ids:
+            if self.agent.get_state({"configurable": {"thread_id": run_id}}).next:
+                return run_id
+        return None
+    
+    def has_run(self, run_id: str) -> bool:
+        """
+        Check whether the checkpoint store holds any step of a run.
+        
+        Args:
+            run_id (str): Run ID to look up.
+            
+        Returns:
+            bool: True if the run can be resumed.
+        """
+        for _ in self.checkpointer.list({"configurable": {"thread_id": run_id}}, limit=1):
+            return True
+        return False
+    
+    def research_and_generate_report(self, run_id: str = None, resume: bool = False) -> str:
         """
         Execute deep research across multiple search queries to generate comprehensive report.
         
+        Every agent step is checkpointed under the run ID, so a failed run can
+        be resumed and only the steps that had not finished are executed again.
+        
+        Args:
+            run_id (str): Optional run ID; a new one is generated if omitted.
+            resume (bool): Continue ``run_id`` (or, without one, today's
+                latest unfinished run) from its last completed step. A new
+                run is started when there is nothing to resume.
+        
         Returns:
             str: The generated news report content.
         """
+        if resume:
+            run_id = run_id or self._latest_unfinished_run_id()
+            if run_id and self.has_run(run_id):
+                return self._resume_research(run_id)
+            print("ℹ️  No checkpointed run to resume, starting a new run")
+        
+        self.run_id = run_id or new_run_id()
         print("🔍 Starting deep AI news research...")
+        print(f"🆔 Run ID: {self.run_id}")
         
         # Get current date for validation
         current_date = datetime.now()
@@ -166,11 +278,55 @@ CRITICAL REQUIREMENTS:
 
 Create a comprehensive daily news report following the format specified in your system prompt."""
         
+        return self._invoke_agent({
+            "messages": [{"role": "user", "content": user_message}]
+        })
+    
+    def _resume_research(self, run_id: str) -> str:
+        """
+        Continue a checkpointed run from its last completed step.
+        
+        Args:
+            run_id (str): Run to resume.
+            
+        Returns:
+            str: The generated news report content.
+        """
+        self.run_id = run_id
+        state = self.agent.get_state(self._run_config())
+        if not state.values:
+            raise ValueError(f"No checkpoints found for run ID: {self.run_id}")
+        
+        if not state.next:
+            print(f"✅ Run {self.run_id} already completed, reusing its result")
+            return self._extract_content_from_response(state.values)
+        
+        print(f"🔁 Resuming run {self.run_id} from its last completed step...")
+        return self._invoke_agent(None)
+    
+    def _run_config(self) -> dict:
+        """
+        Get the graph config that binds checkpoints to the current run.
+        
+        Returns:
+            dict: Runnable config with the run ID as thread ID.
+        """
+        return {"configurable": {"thread_id": self.run_id}}
+    
+    def _invoke_agent(self, agent_input) -> str:
+        """
+        Run the agent for the current run ID and extract the report.
+        
+        Args:
+            agent_input: Initial agent input, or None to continue from the
+                last checkpoint.
+            
+        Returns:
+            str: The generated news report content.
+        """
         try:
             # Execute agent with comprehensive research
-            response = self.agent.invoke({
-                "messages": [{"role": "user", "content": user_message}]
-            })
+            response = self.agent.invoke(agent_input, config=self._run_config())
             
             # Extract content from response - handle various formats including Gemini 2.5 Flash
             content = self._extract_content_from_response(response)
@@ -180,7 +336,13 @@ Create a comprehensive daily news report following the format specified in your
             
         except Exception as e:
             print(f"❌ Error during research: {str(e)}")
+            print(f"💾 Progress is checkpointed, rerun with: --resume --run-id {self.run_id}")
             raise
+        finally:
+            self.hedging.stats.save(Config.MODEL_STATS_FILE, run_id=self.run_id)
+            self.hedging.stats.reset()
+            self.freshness.report()
+            self.freshness.reset()
     
     def _extract_content_from_response(self, response) -> str:
         """
@@ -256,14 +418,24 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description="AI News Agent - Research Phase")
     parser.add_argument("--output", help="Path to save the generated news content")
+    parser.add_argument("--run-id", help="ID of the research run (generated if omitted)")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Continue the run given by --run-id, or today's latest unfinished run, "
+            "from its last completed step; starts a new run if there is none"
+        )
+    )
+    parser.add_argument("--checkpoint-db", help="Path of the SQLite checkpoint store")
     args = parser.parse_args()
     
     try:
         # Validate config first
         Config.validate()
         
-        agent = AINewsAgent()
-        content = agent.research_and_generate_report()
+        agent = AINewsAgent(checkpoint_path=args.checkpoint_db)
+        content = agent.research_and_generate_report(run_id=args.run_id, resume=args.resume)
         
         if args.output:
             output_path = Path(args.output)
@@ -19,26 +19,81 @@ class Config:
     # Discord Webhook Configuration
     DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL")
     
+    # Email (SMTP) Configuration
+    GMAIL_USER = os.getenv("GMAIL_USER")
+    GMAIL_PASSWORD = os.getenv("GMAIL_PASSWORD")
+    EMAIL_FROM = os.getenv("EMAIL_FROM", GMAIL_USER)
+    RECIPIENT_EMAILS = [
+        address.strip()
+        for address in os.getenv("RECIPIENT_EMAIL", "").split(",")
+        if address.strip()
+    ]
+    SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
+    SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
+    SMTP_USE_TLS = os.getenv("SMTP_USE_TLS", "true").lower() in ("1", "true", "yes")
+    SMTP_TIMEOUT_SECONDS = float(os.getenv("SMTP_TIMEOUT_SECONDS", "30"))
+    EMAIL_BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", "50"))
+    EMAIL_MAX_CONNECTIONS = int(os.getenv("EMAIL_MAX_CONNECTIONS", "3"))
+    EMAIL_MAX_RETRIES = int(os.getenv("EMAIL_MAX_RETRIES", "3"))
+    
     # Agent Configuration
     MODEL_NAME = "models/gemini-3-flash-preview"
+    FALLBACK_MODEL_NAMES = [
+        name.strip()
+        for name in os.getenv(
+            "FALLBACK_MODEL_NAMES",
+            "models/gemini-2.5-flash,models/gemini-2.5-flash-lite"
+        ).split(",")
+        if name.strip()
+    ]
+    MODEL_TIMEOUT_SECONDS = float(os.getenv("MODEL_TIMEOUT_SECONDS", "120"))
+    MODEL_HEDGE_AFTER_SECONDS = float(os.getenv("MODEL_HEDGE_AFTER_SECONDS", "45"))
+    MODEL_STATS_FILE = os.getenv("MODEL_STATS_FILE", "model_latency_stats.jsonl")
     MAX_SEARCH_RESULTS = 10
+    FRESHNESS_WINDOW_HOURS = int(os.getenv("FRESHNESS_WINDOW_HOURS", "24"))
+    CHECKPOINT_DB = os.getenv("CHECKPOINT_DB", "agent_checkpoints.sqlite")
     
     # Report Configuration
     REPORT_TITLE = "Daily AI & Automation News Report"
     REPORT_FILENAME = "ai_news_report.pdf"
     
+    # Digest Configuration
+    DIGEST_TITLE = "Weekly AI & Automation News Digest"
+    DIGEST_FILENAME = "ai_news_digest.pdf"
+    REPORTS_DIR = os.getenv("REPORTS_DIR", "reports")
+    
+    # Worker Daemon Configuration
+    JOB_QUEUE_DB = os.getenv("JOB_QUEUE_DB", "jobs.sqlite")
+    WORKER_COUNT = int(os.getenv("WORKER_COUNT", "2"))
+    WORKER_POLL_SECONDS = float(os.getenv("WORKER_POLL_SECONDS", "0.5"))
+    WORKER_HEARTBEAT_SECONDS = float(os.getenv("WORKER_HEARTBEAT_SECONDS", "15"))
+    WORKER_STALE_SECONDS = float(os.getenv("WORKER_STALE_SECONDS", "90"))
+    WORKER_MAX_ATTEMPTS = int(os.getenv("WORKER_MAX_ATTEMPTS", "3"))
+    
     # Validation
     @classmethod
-    def validate(cls):
+    def validate(cls, delivery: str = "discord"):
         """
         Validate that all required environment variables are set.
+        
+        Args:
+            delivery (str): Delivery channel whose settings are required as
+                well: ``discord``, ``email`` or None for research only.
         """
         required_vars = {
             "GOOGLE_API_KEY": cls.GOOGLE_API_KEY,
             "TAVILY_API_KEY": cls.TAVILY_API_KEY,
-            "DISCORD_WEBHOOK_URL": cls.DISCORD_WEBHOOK_URL,
         }
         
+        if delivery == "discord":
+            required_vars["DISCORD_WEBHOOK_URL"] = cls.DISCORD_WEBHOOK_URL
+        elif delivery == "email":
+            required_vars.update({
+                "GMAIL_USER": cls.GMAIL_USER,
+                "GMAIL_PASSWORD": cls.GMAIL_PASSWORD,
+                "RECIPIENT_EMAIL": cls.RECIPIENT_EMAILS,
+            })
+        
         missing_vars = [var for var, value in required_vars.items() if not value]
         
         if missing_vars:
@@ -1,9 +1,12 @@
 """
 Discord webhook sender for the AI News Agent.
-Sends daily news reports as Discord messages with PDF attachments.
+Sends daily news reports as Discord messages with PDF attachments or
+rich embeds.
 """
 import os
 import sys
+import json
+import time
 import argparse
 import requests
 
@@ -13,14 +16,16 @@ class DiscordSender:
     Handles sending news reports via Discord webhook.
     """
     
-    def __init__(self, webhook_url: str):
+    def __init__(self, webhook_url: str, session: requests.Session = None):
         """
         Initialize the Discord sender.
         
         Args:
             webhook_url: Discord webhook URL from KV Store
+            session: Optional HTTP session to reuse connections across sends
         """
         self.webhook_url = webhook_url
+        self.session = session or requests
     
     def send_report(self, pdf_path: str) -> bool:
         """
@@ -52,7 +57,7 @@ class DiscordSender:
                 
                 # Send to Discord webhook
                 print(f"📨 Sending report to Discord...")
-                response = requests.post(
+                response = self.session.post(
                     self.webhook_url,
                     data=data,
                     files=files
@@ -70,6 +75,43 @@ class DiscordSender:
         except Exception as e:
             print(f"❌ Failed to send report: {e}")
             return False
+    
+    def send_embeds(self, payloads: list) -> bool:
+        """
+        Send the news report to Discord as embed messages.
+        
+        The payloads come from the Discord renderer of report_formats, which
+        already keeps every message within Discord's embed limits, so they
+        can be posted as soon as the report is parsed, before the PDF exists.
+        
+        Args:
+            payloads: Webhook JSON payloads, sent in order
+            
+        Returns:
+            bool: True if every message was sent, False otherwise
+        """
+        try:
+            print(f"📨 Sending report to Discord as {len(payloads)} embed message(s)...")
+            for payload in payloads:
+                response = self.session.post(self.webhook_url, json=payload)
+                
+                # Wait out the webhook rate limit once before giving up
+                if response.status_code == 429:
+                    time.sleep(float(response.json().get('retry_after', 1)))
+                    response = self.session.post(self.webhook_url, json=payload)
+                
+                response.raise_for_status()
+            
+            print(f"✅ Report embeds sent successfully to Discord!")
+            return True
+            
+        except requests.exceptions.HTTPError as e:
+            print(f"❌ HTTP Error from Discord: {e}")
+            print(f"❌ Response: {e.response.text if e.response else 'No response'}")
+            return False
+        except Exception as e:
+            print(f"❌ Failed to send report embeds: {e}")
+            return False
 
 
 def main():
@@ -77,9 +119,13 @@ def main():
     Main function to send the report via Discord webhook.
     """
     parser = argparse.ArgumentParser(description="Send AI News Report via Discord Webhook")
-    parser.add_argument("--file", required=True, help="Path to the PDF file to send")
+    parser.add_argument("--file", help="Path to the PDF file to send")
+    parser.add_argument("--embeds", help="Path to the Discord embed payloads (.discord.json) to send")
     args = parser.parse_args()
     
+    if not args.file and not args.embeds:
+        parser.error("at least one of --file or --embeds is required")
+    
     # Get the Discord webhook URL from environment
     webhook_url = os.getenv("DISCORD_WEBHOOK_URL")
     
@@ -87,9 +133,16 @@ def main():
         print("❌ Error: DISCORD_WEBHOOK_URL environment variable is not set")
         sys.exit(1)
     
-    # Create sender and send report
+    # Create sender and send report, embeds first as they are ready first
     sender = DiscordSender(webhook_url)
-    success = sender.send_report(args.file)
+    success = True
+    
+    if args.embeds:
+        with open(args.embeds, encoding='utf-8') as embeds_file:
+            success = sender.send_embeds(json.load(embeds_file))
+    
+    if args.file:
+        success = sender.send_report(args.file) and success
     
     if not success:
         sys.exit(1)
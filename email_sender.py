@@ -0,0 +1,346 @@
+"""
+SMTP email sender for the AI News Agent.
+Delivers the PDF report to a distribution list over pooled, authenticated
+SMTP connections.
+"""
+import argparse
+import os
+import queue
+import smtplib
+import sys
+import threading
+import time
+from datetime import datetime
+from email import policy
+from email.message import EmailMessage
+from email.utils import formatdate, make_msgid
+from config import Config
+
+
+# Errors after which the connection is dropped and the batch retried
+TRANSIENT_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+class EmailSender:
+    """
+    Handles sending news reports via SMTP.
+
+    The message and its PDF attachment are built and serialized once. The
+    recipients are split into batches that share one SMTP transaction, and
+    the batches are sent by a few worker threads, each holding a single
+    authenticated connection for all of its batches.
+    """
+
+    def __init__(
+        self,
+        recipients=None,
+        sender: str = None,
+        host: str = None,
+        port: int = None,
+        username: str = None,
+        password: str = None,
+        use_tls: bool = None,
+        batch_size: int = None,
+        max_connections: int = None,
+        max_retries: int = None,
+    ):
+        """
+        Initialize the email sender; unset arguments come from Config.
+
+        Args:
+            recipients (list): Recipient addresses.
+            sender (str): From address, defaults to the SMTP login.
+            host (str): SMTP server host.
+            port (int): SMTP server port.
+            username (str): SMTP login; no login is attempted when empty.
+            password (str): SMTP password (a Gmail app password).
+            use_tls (bool): Upgrade the connection with STARTTLS.
+            batch_size (int): Recipients per SMTP transaction.
+            max_connections (int): Concurrent SMTP connections.
+            max_retries (int): Retries of a batch after a transient failure.
+        """
+        self.recipients = list(recipients or Config.RECIPIENT_EMAILS)
+        self.host = host or Config.SMTP_HOST
+        self.port = port or Config.SMTP_PORT
+        self.username = Config.GMAIL_USER if username is None else username
+        self.password = Config.GMAIL_PASSWORD if password is None else password
+        self.use_tls = Config.SMTP_USE_TLS if use_tls is None else use_tls
+        self.batch_size = batch_size or Config.EMAIL_BATCH_SIZE
+        self.max_connections = max_connections or Config.EMAIL_MAX_CONNECTIONS
+        self.max_retries = Config.EMAIL_MAX_RETRIES if max_retries is None else max_retries
+        self.sender = sender or Config.EMAIL_FROM or self.username
+
+        if not self.recipients:
+            raise ValueError("No email recipients configured (RECIPIENT_EMAIL)")
+        if not self.sender:
+            raise ValueError("No sender address configured (GMAIL_USER or EMAIL_FROM)")
+
+    def send_report(self, pdf_path: str) -> bool:
+        """
+        Send the news report to every recipient with the PDF attached.
+
+        Args:
+            pdf_path: Path to the PDF file to send
+
+        Returns:
+            bool: True if every recipient was accepted, False otherwise
+        """
+        try:
+            if not os.path.exists(pdf_path):
+                print(f"❌ PDF file not found: {pdf_path}")
+                return False
+
+            # Build and serialize the message once for all recipients
+            message = self._build_message(pdf_path)
+            data = message.as_bytes(policy=policy.SMTP)
+
+            batches = [
+                self.recipients[start:start + self.batch_size]
+                for start in range(0, len(self.recipients), self.batch_size)
+            ]
+            print(
+                f"📧 Sending report to {len(self.recipients)} recipient(s) in "
+                f"{len(batches)} batch(es)..."
+            )
+            failed = self._send_batches(batches, data)
+
+            if failed:
+                print(f"❌ Delivery failed for {len(failed)} recipient(s):")
+                for recipient, reason in sorted(failed.items())[:10]:
+                    print(f"   - {recipient}: {reason}")
+                if len(failed) > 10:
+                    print(f"   ... and {len(failed) - 10} more")
+                return False
+
+            print(f"✅ Report emailed successfully to {len(self.recipients)} recipient(s)!")
+            return True
+
+        except Exception as e:
+            print(f"❌ Failed to send report: {e}")
+            return False
+
+    def _build_message(self, pdf_path: str) -> EmailMessage:
+        """
+        Build the report email with the PDF attachment.
+
+        Recipients are only given in the SMTP envelope, so the same message
+        is sent to every batch without disclosing the distribution list.
+
+        Args:
+            pdf_path: Path to the PDF file to attach
+
+        Returns:
+            EmailMessage: The message ready to be sent.
+        """
+        message = EmailMessage()
+        message["Subject"] = f"{Config.REPORT_TITLE} - {datetime.now().strftime('%B %d, %Y')}"
+        message["From"] = self.sender
+        message["To"] = "undisclosed-recipients:;"
+        message["Date"] = formatdate(localtime=True)
+        message["Message-ID"] = make_msgid()
+        message.set_content("📰 Daily AI News Report\n\nHere's your daily AI news digest, attached as a PDF.")
+
+        with open(pdf_path, "rb") as pdf_file:
+            message.add_attachment(
+                pdf_file.read(),
+                maintype="application",
+                subtype="pdf",
+                filename=os.path.basename(pdf_path),
+            )
+
+        return message
+
+    def _send_batches(self, batches: list, data: bytes) -> dict:
+        """
+        Send the batches over up to ``max_connections`` connections.
+
+        Args:
+            batches (list): Lists of recipient addresses.
+            data (bytes): Serialized message.
+
+        Returns:
+            dict: Reason of failure for each recipient that was not accepted.
+        """
+        pending = queue.Queue()
+        for batch in batches:
+            pending.put(batch)
+
+        failed = {}
+        lock = threading.Lock()
+
+        def worker():
+            connection = None
+            try:
+                while True:
+                    try:
+                        batch = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        connection, refused = self._send_batch(connection, batch, data)
+                    except Exception as e:
+                        self._close(connection)
+                        connection = None
+                        refused = {recipient: str(e) or type(e).__name__ for recipient in batch}
+                    with lock:
+                        failed.update(refused)
+            finally:
+                self._close(connection)
+
+        threads = [
+            threading.Thread(target=worker, name=f"smtp-{index}")
+            for index in range(min(self.max_connections, len(batches)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return failed
+
+    def _send_batch(self, connection, batch: list, data: bytes):
+        """
+        Send one batch, reconnecting and retrying on transient failures.
+
+        Args:
+            connection (smtplib.SMTP): Open connection, or None to open one.
+            batch (list): Recipient addresses of the batch.
+            data (bytes): Serialized message.
+
+        Returns:
+            tuple: The connection to reuse (or None) and a dict of the
+                recipients that could not be delivered with the reason.
+        """
+        remaining = list(batch)
+        failed = {}
+        retry_reasons = {}
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(min(2 ** (attempt - 1), 30))
+
+            try:
+                if connection is None:
+                    connection = self._connect()
+                rejected = connection.sendmail(self.sender, remaining, data)
+            except smtplib.SMTPRecipientsRefused as e:
+                rejected = e.recipients
+            except smtplib.SMTPResponseException as e:
+                reason = _reason(e.smtp_code, e.smtp_error)
+                if not _is_transient(e.smtp_code):
+                    failed.update((recipient, reason) for recipient in remaining)
+                    return connection, failed
+                retry_reasons = {recipient: reason for recipient in remaining}
+                connection = self._reset(connection) if connection else None
+                continue
+            except TRANSIENT_ERRORS as e:
+                reason = str(e) or type(e).__name__
+                retry_reasons = {recipient: reason for recipient in remaining}
+                self._close(connection)
+                connection = None
+                continue
+
+            # Permanent per-recipient rejections are final, temporary ones retried
+            remaining = []
+            retry_reasons = {}
+            for recipient, (code, error) in rejected.items():
+                if _is_transient(code):
+                    remaining.append(recipient)
+                    retry_reasons[recipient] = _reason(code, error)
+                else:
+                    failed[recipient] = _reason(code, error)
+            if not remaining:
+                return connection, failed
+
+        failed.update(retry_reasons)
+        return connection, failed
+
+    def _connect(self) -> smtplib.SMTP:
+        """
+        Open and authenticate an SMTP connection.
+
+        Returns:
+            smtplib.SMTP: Connection ready to send.
+        """
+        connection = smtplib.SMTP(self.host, self.port, timeout=Config.SMTP_TIMEOUT_SECONDS)
+        try:
+            connection.ehlo()
+            if self.use_tls:
+                connection.starttls()
+                connection.ehlo()
+            if self.username:
+                connection.login(self.username, self.password)
+        except Exception:
+            self._close(connection)
+            raise
+        return connection
+
+    def _reset(self, connection):
+        """
+        Reset the transaction of a connection after a failed send.
+
+        Args:
+            connection (smtplib.SMTP): Connection to reset.
+
+        Returns:
+            smtplib.SMTP: The connection, or None if it had to be dropped.
+        """
+        try:
+            connection.rset()
+            return connection
+        except Exception:
+            self._close(connection)
+            return None
+
+    def _close(self, connection):
+        """
+        Close a connection, ignoring errors from a server that already left.
+
+        Args:
+            connection (smtplib.SMTP): Connection to close, or None.
+        """
+        if connection is None:
+            return
+        try:
+            connection.quit()
+        except Exception:
+            connection.close()
+
+
+def _is_transient(code: int) -> bool:
+    """Check whether an SMTP reply code is a temporary (4xx) failure."""
+    return 400 <= code < 500
+
+
+def _reason(code: int, error) -> str:
+    """Format an SMTP reply as a failure reason."""
+    if isinstance(error, bytes):
+        error = error.decode("utf-8", errors="replace")
+    return f"{code} {error}"
+
+
+def main():
+    """
+    Main function to send the report via email.
+    """
+    parser = argparse.ArgumentParser(description="Send AI News Report via Email")
+    parser.add_argument("--file", required=True, help="Path to the PDF file to send")
+    parser.add_argument("--to", help="Comma-separated recipients (defaults to RECIPIENT_EMAIL)")
+    args = parser.parse_args()
+
+    recipients = [address.strip() for address in args.to.split(",") if address.strip()] if args.to else None
+
+    try:
+        sender = EmailSender(recipients=recipients)
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    success = sender.send_report(args.file)
+
+    if not success:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
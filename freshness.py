@@ -0,0 +1,230 @@
+"""
+Freshness filter for the AI News Agent.
+Finds the published date of search results and drops stale ones before
+they reach the model.
+"""
+import calendar
+import re
+import threading
+from datetime import date, datetime, timedelta
+from email.utils import parsedate_to_datetime
+
+
+MONTHS = {
+    name.lower(): index
+    for index in range(1, 13)
+    for name in (calendar.month_name[index], calendar.month_abbr[index])
+}
+MONTH_PATTERN = "|".join(sorted(MONTHS, key=len, reverse=True))
+
+# /2025/12/23/ or /2025-12-23 or /20251223/ in URL paths, then /2025/12/
+URL_DAY_PATTERN = re.compile(r"/(20\d{2})[/\-_]?(0[1-9]|1[0-2])[/\-_]?(0[1-9]|[12]\d|3[01])(?=[/\-_.]|$)")
+URL_MONTH_PATTERN = re.compile(r"/(20\d{2})/(0[1-9]|1[0-2])/")
+
+# "December 23, 2025", "Dec 23 2025", "23 December 2025", "2025-12-23"
+TEXT_DATE_PATTERNS = (
+    re.compile(rf"\b({MONTH_PATTERN})\.?\s+(\d{{1,2}})(?:st|nd|rd|th)?,?\s+(20\d{{2}})\b", re.IGNORECASE),
+    re.compile(rf"\b(\d{{1,2}})(?:st|nd|rd|th)?\s+({MONTH_PATTERN})\.?,?\s+(20\d{{2}})\b", re.IGNORECASE),
+    re.compile(r"\b(20\d{2})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])\b"),
+)
+RELATIVE_DATE_PATTERN = re.compile(
+    r"\b(\d{1,3}|an?|one)\s+(minute|hour|day|week)s?\s+ago\b", re.IGNORECASE
+)
+
+
+class FreshnessFilter:
+    """
+    Drop search results published outside the freshness window.
+
+    The published date is taken from the result metadata, then from a date
+    in the URL path, then from the latest date mentioned in the snippet.
+    Results without any detectable date are kept. Snippet dates can only
+    mark a result as fresh: a fresh article may mention nothing but past
+    events, so a result whose only date is an old snippet date is kept as
+    undated.
+    """
+
+    def __init__(self, window_hours: int = 24):
+        """
+        Initialize the filter.
+
+        Args:
+            window_hours (int): Age in hours of the oldest news to keep.
+        """
+        self.window_hours = window_hours
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear the counters, e.g. before the next run of a long-lived agent."""
+        with self._lock:
+            self.counts = {
+                "candidates": 0,
+                "kept": 0,
+                "dropped": 0,
+                "undated": 0,
+                "dropped_tokens": 0,
+            }
+
+    def filter(self, results: list, now: datetime = None) -> list:
+        """
+        Keep only the results published inside the window.
+
+        Args:
+            results (list): Raw search results (dicts with url, title,
+                content and optionally published_date).
+            now (datetime): Reference time, defaults to the current time.
+
+        Returns:
+            list: The fresh (or undated) results, in their original order.
+        """
+        now = now or datetime.now()
+        # Dates are compared by day, as URL and snippet dates have no time
+        first_day = (now - timedelta(hours=self.window_hours)).date()
+
+        kept = []
+        counts = {"candidates": len(results), "kept": 0, "dropped": 0, "undated": 0, "dropped_tokens": 0}
+        for result in results:
+            published, from_text = _find_published_date(result, now)
+            if published is None or (from_text and published < first_day):
+                counts["undated"] += 1
+            elif published < first_day:
+                counts["dropped"] += 1
+                counts["dropped_tokens"] += estimate_tokens(result)
+                continue
+            kept.append(result)
+        counts["kept"] = len(kept)
+
+        with self._lock:
+            for key, value in counts.items():
+                self.counts[key] += value
+
+        return kept
+
+    def report(self) -> dict:
+        """
+        Print how many candidates and tokens the filter removed.
+
+        Returns:
+            dict: The counters of the run.
+        """
+        with self._lock:
+            counts = dict(self.counts)
+        print(
+            f"🗓️  Freshness filter: dropped {counts['dropped']} of {counts['candidates']} "
+            f"search results (~{counts['dropped_tokens']} tokens), "
+            f"{counts['undated']} kept without a date"
+        )
+        return counts
+
+
+def extract_published_date(result: dict, now: datetime = None):
+    """
+    Find the published date of a search result.
+
+    Args:
+        result (dict): Search result with url, title, content and optionally
+            published_date.
+        now (datetime): Reference time for relative dates such as "2 days ago".
+
+    Returns:
+        date: The published date (for month-only URL dates, the last day of
+            the month), or None if no date was found.
+    """
+    return _find_published_date(result, now or datetime.now())[0]
+
+
+def estimate_tokens(result: dict) -> int:
+    """
+    Estimate the prompt tokens a search result would cost.
+
+    Args:
+        result (dict): Search result.
+
+    Returns:
+        int: Rough token count (about four characters per token).
+    """
+    characters = sum(len(str(result.get(key) or "")) for key in ("title", "url", "content"))
+    return characters // 4
+
+
+def _find_published_date(result: dict, now: datetime):
+    """
+    Find the published date of a search result and where it came from.
+
+    Returns:
+        tuple: The date (or None) and whether it was only found in the
+            title or snippet text.
+    """
+    published = _parse_metadata_date(result.get("published_date"))
+    if published:
+        return published, False
+
+    url = result.get("url") or ""
+    match = URL_DAY_PATTERN.search(url)
+    if match:
+        published = _make_date(*match.groups())
+        if published:
+            return published, False
+    match = URL_MONTH_PATTERN.search(url)
+    if match:
+        year, month = int(match.group(1)), int(match.group(2))
+        return date(year, month, calendar.monthrange(year, month)[1]), False
+
+    text = f"{result.get('title') or ''} {result.get('content') or ''}"
+    published = _latest_text_date(text, now)
+    return published, published is not None
+
+
+def _parse_metadata_date(value):
+    """Parse a published_date field (RFC 2822 or ISO 8601)."""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+
+    value = str(value).strip()
+    for parse in (parsedate_to_datetime, lambda text: datetime.fromisoformat(text.replace("Z", "+00:00"))):
+        try:
+            parsed = parse(value)
+        except (TypeError, ValueError, IndexError):
+            continue
+        if parsed.tzinfo:
+            parsed = parsed.astimezone()
+        return parsed.date()
+
+    match = TEXT_DATE_PATTERNS[2].search(value)
+    return _make_date(*match.groups()) if match else None
+
+
+def _latest_text_date(text: str, now: datetime):
+    """Find the most recent absolute or relative date mentioned in text."""
+    found = []
+
+    for match in TEXT_DATE_PATTERNS[0].finditer(text):
+        month, day, year = match.groups()
+        found.append(_make_date(year, MONTHS[month.lower().rstrip(".")], day))
+    for match in TEXT_DATE_PATTERNS[1].finditer(text):
+        day, month, year = match.groups()
+        found.append(_make_date(year, MONTHS[month.lower().rstrip(".")], day))
+    for match in TEXT_DATE_PATTERNS[2].finditer(text):
+        found.append(_make_date(*match.groups()))
+
+    for match in RELATIVE_DATE_PATTERN.finditer(text):
+        amount, unit = match.groups()
+        amount = 1 if not amount.isdigit() else int(amount)
+        found.append((now - timedelta(**{f"{unit.lower()}s": amount})).date())
+
+    # Future dates are usually announced events, not the publication date
+    found = [value for value in found if value and value <= now.date()]
+    return max(found) if found else None
+
+
+def _make_date(year, month, day):
+    """Build a date from its parts, or None if they are not a valid date."""
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
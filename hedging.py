@@ -0,0 +1,292 @@
+"""
+Latency-aware model invocation for the AI News Agent.
+Adds per-call deadlines, hedged duplicate requests and a model fallback chain.
+"""
+import contextvars
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from datetime import datetime
+from pathlib import Path
+from langchain.agents.middleware import AgentMiddleware
+from langchain_core.messages import AIMessage
+from langgraph.errors import GraphBubbleUp
+
+
+class HedgedModelMiddleware(AgentMiddleware):
+    """
+    Agent middleware that bounds the latency of every model call.
+
+    Each model in the chain (the agent's model first, then the fallbacks)
+    gets a deadline. If it has not answered after the hedge threshold, a
+    duplicate request is sent and the first valid response wins. When a
+    model errors, returns an empty response or misses its deadline, the next
+    model in the chain is tried.
+
+    Requests run on threads, which cannot be stopped from outside: a losing
+    request is abandoned, not cancelled. Each request is sent with its
+    client ``timeout`` capped at the time left before the deadline, so a
+    loser ends by the deadline at the latest.
+    """
+
+    def __init__(self, fallback_models=None, timeout: float = 120.0, hedge_after: float = 45.0):
+        """
+        Initialize the middleware.
+
+        Args:
+            fallback_models (list): Chat models to try, in order, when the
+                primary model fails or misses its deadline.
+            timeout (float): Deadline in seconds for each model in the chain.
+            hedge_after (float): Seconds to wait (the observed p95 latency)
+                before sending a hedged duplicate request.
+        """
+        super().__init__()
+        self.fallback_models = list(fallback_models or [])
+        self.timeout = timeout
+        self.hedge_after = hedge_after
+        self.stats = HedgingStats()
+
+    def wrap_model_call(self, request, handler):
+        """
+        Run the model call with deadline, hedging and fallbacks.
+
+        Args:
+            request (ModelRequest): Model request built by the agent.
+            handler (callable): Executes a model request.
+
+        Returns:
+            ModelResponse: The first valid response.
+
+        Raises:
+            Exception: The last error if every model in the chain failed.
+        """
+        started = time.monotonic()
+        last_error = None
+
+        for position, model in enumerate([request.model, *self.fallback_models]):
+            model_request = request if position == 0 else request.override(model=model)
+            if position:
+                self.stats.record("fallbacks")
+                print(f"↪️  Falling back to model: {_model_name(model)}")
+
+            try:
+                response, hedge_won = self._call_with_hedge(model_request, handler)
+            except GraphBubbleUp:
+                raise
+            except Exception as e:
+                last_error = e
+                continue
+
+            self.stats.record("calls", latency=time.monotonic() - started)
+            if hedge_won:
+                self.stats.record("hedge_wins")
+            return response
+
+        self.stats.record("failures")
+        raise last_error
+
+    def _call_with_hedge(self, request, handler):
+        """
+        Call one model, sending a hedged duplicate if it is slow.
+
+        Args:
+            request (ModelRequest): Model request to execute.
+            handler (callable): Executes a model request.
+
+        Returns:
+            tuple: The first valid response and whether the hedge produced it.
+
+        Raises:
+            TimeoutError: If no valid response arrived before the deadline.
+            Exception: The error of the last failed request.
+        """
+        deadline = time.monotonic() + self.timeout
+        pending = {self._submit(handler, request, deadline): False}
+        hedged = False
+        last_error = None
+
+        # Losers are not waited for: they keep running until their capped
+        # client timeout at the latest and their results are ignored
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.stats.record("timeouts")
+                raise TimeoutError(
+                    f"{_model_name(request.model)} did not answer within {self.timeout:.0f}s"
+                )
+
+            wait_for = remaining if hedged else min(remaining, self.hedge_after)
+            done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            if not done:
+                if not hedged:
+                    hedged = True
+                    self.stats.record("hedges")
+                    print(f"⏱️  Slow model response, sending hedged request...")
+                    pending[self._submit(handler, request, deadline)] = True
+                continue
+
+            for future in done:
+                is_hedge = pending.pop(future)
+                try:
+                    response = future.result()
+                except Exception as e:
+                    last_error = e
+                    continue
+                if _is_valid_response(response):
+                    return response, is_hedge
+                last_error = ValueError(
+                    f"{_model_name(request.model)} returned an empty response"
+                )
+
+        raise last_error
+
+    def _submit(self, handler, request, deadline: float):
+        """
+        Run a model request on its own thread, bounded by the deadline.
+
+        A shared pool would let losers that are stuck until the client
+        timeout hold its workers, so later calls would queue behind them
+        and lose part of their deadline waiting. The caller's context is
+        copied so the graph's runnable config and callbacks are visible to
+        the thread.
+
+        Args:
+            handler (callable): Executes a model request.
+            request (ModelRequest): Model request to execute.
+            deadline (float): ``time.monotonic()`` value the request must
+                not outlive; passed to the client as its ``timeout``.
+
+        Returns:
+            Future: Future of the model response.
+        """
+        remaining = max(deadline - time.monotonic(), 1.0)
+        request = request.override(model_settings={**request.model_settings, "timeout": remaining})
+        context = contextvars.copy_context()
+        future = Future()
+
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = context.run(handler, request)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        threading.Thread(target=run, name="model-call", daemon=True).start()
+        return future
+
+
+class HedgingStats:
+    """Counters and latencies of the hedged model calls of one run."""
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear the counters, e.g. before the next run of a long-lived agent."""
+        with self._lock:
+            self.counts = {
+                "calls": 0,
+                "hedges": 0,
+                "hedge_wins": 0,
+                "fallbacks": 0,
+                "timeouts": 0,
+                "failures": 0,
+            }
+            self.latencies = []
+
+    def record(self, event: str, latency: float = None):
+        """
+        Record an event and, optionally, the latency of a successful call.
+
+        Args:
+            event (str): Name of the counter to increment.
+            latency (float): Seconds the call took.
+        """
+        with self._lock:
+            self.counts[event] += 1
+            if latency is not None:
+                self.latencies.append(latency)
+
+    def summary(self) -> dict:
+        """
+        Summarize the run for threshold tuning.
+
+        Returns:
+            dict: Counters, hedge/fallback rates and latency percentiles.
+        """
+        with self._lock:
+            calls = self.counts["calls"] + self.counts["failures"]
+            latencies = sorted(self.latencies)
+            summary = dict(self.counts)
+
+        summary["hedge_rate"] = round(summary["hedges"] / calls, 3) if calls else 0.0
+        summary["fallback_rate"] = round(summary["fallbacks"] / calls, 3) if calls else 0.0
+        summary["p50_seconds"] = _percentile(latencies, 0.50)
+        summary["p95_seconds"] = _percentile(latencies, 0.95)
+        return summary
+
+    def save(self, stats_path: str, run_id: str = None) -> dict:
+        """
+        Print the summary and append it to a JSON Lines file.
+
+        Args:
+            stats_path (str): Path of the JSON Lines stats file.
+            run_id (str): Optional ID of the run the stats belong to.
+
+        Returns:
+            dict: The saved summary.
+        """
+        summary = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "run_id": run_id,
+            **self.summary(),
+        }
+        p95 = f"{summary['p95_seconds']}s" if summary["p95_seconds"] is not None else "n/a"
+        print(
+            f"📊 Model calls: {summary['calls']}, hedge rate: {summary['hedge_rate']:.0%}, "
+            f"fallback rate: {summary['fallback_rate']:.0%}, p95: {p95}"
+        )
+
+        path = Path(stats_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as stats_file:
+            stats_file.write(json.dumps(summary) + "\n")
+
+        return summary
+
+
+def _is_valid_response(response) -> bool:
+    """
+    Check that a model response carries text or tool calls.
+
+    Args:
+        response: Result returned by the model handler.
+
+    Returns:
+        bool: True if the response can be used by the agent.
+    """
+    messages = getattr(response, "result", None) or [response]
+    message = messages[0]
+    if not isinstance(message, AIMessage):
+        return False
+    return bool(message.tool_calls or message.content)
+
+
+def _model_name(model) -> str:
+    """Get a readable name for a chat model."""
+    return getattr(model, "model", None) or type(model).__name__
+
+
+def _percentile(values: list, fraction: float):
+    """Get a percentile from sorted values, or None if there are none."""
+    if not values:
+        return None
+    index = min(len(values) - 1, int(round(fraction * (len(values) - 1))))
+    return round(values[index], 2)
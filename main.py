@@ -7,7 +7,7 @@ from datetime import datetime
 from pathlib import Path
 from config import Config
 from agent import AINewsAgent
-from pdf_generator import NewsReportGenerator
+from pdf_generator import NewsReportGenerator, store_report
 from email_sender import EmailSender
 
 
@@ -22,7 +22,9 @@ def main():
     try:
         # Step 1: Validate configuration
         print("\n🔍 Step 1/4: Validating configuration...")
-        Config.validate()
+        Config.validate(delivery="email")
+        # Fail on bad email settings before paying for research and the PDF
+        email_sender = EmailSender()
         print("✅ Configuration validated successfully!")
         
         # Step 2: Run the AI agent to research news
@@ -34,6 +36,7 @@ def main():
         content_file = Path("news_content.txt")
         content_file.write_text(news_content, encoding='utf-8')
         print(f"📝 Raw content saved to: {content_file.absolute()}")
+        print(f"🗄️  Report stored for digests: {store_report(news_content)}")
         
         # Step 3: Generate PDF report
         print("\n📄 Step 3/4: Generating PDF report...")
@@ -43,7 +46,6 @@ def main():
         
         # Step 4: Send email with PDF attachment
         print("\n📧 Step 4/4: Sending email report...")
-        email_sender = EmailSender()
         email_success = email_sender.send_report(pdf_path)
         
         if email_success:
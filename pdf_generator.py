@@ -1,14 +1,22 @@
 """
 PDF Report Generator for AI News Agent.
 """
-from datetime import datetime
+import itertools
+import re
+from datetime import date, datetime, timedelta
+from pathlib import Path
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+from reportlab.platypus import (
+    BaseDocTemplate, Frame, PageTemplate, SimpleDocTemplate, Paragraph, Spacer, PageBreak
+)
 from reportlab.lib.colors import HexColor
 from config import Config
+from report_formats import (
+    ITEM_HEADER_PATTERN, RENDERERS, clean_text, clean_url, parse_blocks, parse_report, write_formats
+)
 
 
 class NewsReportGenerator:
@@ -78,6 +86,49 @@ class NewsReportGenerator:
             content (str): The news content generated by the agent.
             output_path (str): Optional custom output path.
             
+        Returns:
+            str: Path to the generated PDF file.
+        """
+        return self.build_report_pdf(parse_report(content), output_path)
+    
+    def render_report(self, content: str, output_path: str = None, formats=("pdf",)) -> dict:
+        """
+        Parse the news content once and render it in several formats.
+        
+        The text formats are written first, so Markdown, HTML, JSON and the
+        Discord embed payloads are ready before the slower PDF build.
+        
+        Args:
+            content (str): The news content generated by the agent.
+            output_path (str): Optional path of the PDF; the other formats are
+                written next to it, named after it without ``.pdf``.
+            formats (tuple): Any of ``pdf``, ``md``, ``html``, ``json`` and
+                ``discord``.
+            
+        Returns:
+            dict: Path of the generated file for each format.
+        """
+        unknown = set(formats) - set(RENDERERS) - {"pdf"}
+        if unknown:
+            raise ValueError(f"Unknown output formats: {', '.join(sorted(unknown))}")
+        
+        report = parse_report(content)
+        output_path = output_path or self.filename
+        outputs = write_formats(report, output_path, [name for name in formats if name != "pdf"])
+        
+        if "pdf" in formats:
+            outputs["pdf"] = self.build_report_pdf(report, output_path)
+        
+        return outputs
+    
+    def build_report_pdf(self, report: dict, output_path: str = None) -> str:
+        """
+        Build the PDF of a parsed report.
+        
+        Args:
+            report (dict): Report from parse_report.
+            output_path (str): Optional custom output path.
+            
         Returns:
             str: Path to the generated PDF file.
         """
@@ -98,17 +149,16 @@ class NewsReportGenerator:
         story = []
         
         # Add title
-        title = Paragraph(Config.REPORT_TITLE, self.styles['CustomTitle'])
+        title = Paragraph(report['title'], self.styles['CustomTitle'])
         story.append(title)
         
         # Add date
-        current_date = datetime.now().strftime("%B %d, %Y")
-        subtitle = Paragraph(current_date, self.styles['CustomSubtitle'])
+        subtitle = Paragraph(report['date'], self.styles['CustomSubtitle'])
         story.append(subtitle)
         story.append(Spacer(1, 0.3 * inch))
         
         # Process and add content
-        self._add_content_to_story(story, content)
+        story.extend(self._iter_block_flowables(report['blocks']))
         
         # Build the PDF
         doc.build(story)
@@ -125,14 +175,7 @@ class NewsReportGenerator:
         Returns:
             str: Cleaned text.
         """
-        import re
-        
-        # Remove excessive double quotes around phrases
-        # But keep quotes that are part of actual quotes
-        text = re.sub(r'""([^"]+)""', r'\1', text)  # Remove double-double quotes
-        text = re.sub(r'"([A-Z][^"]{10,})"', r'\1', text)  # Remove quotes around capitalized phrases
-        
-        return text
+        return clean_text(text)
     
     def _clean_url(self, url: str) -> str:
         """
@@ -144,16 +187,7 @@ class NewsReportGenerator:
         Returns:
             str: Cleaned URL.
         """
-        import re
-        
-        # Remove tracking parameters
-        url = re.sub(r'[?&](utm_[^&]*|ref=[^&]*|fbclid=[^&]*)', '', url)
-        # Fix HTML encoding
-        url = url.replace('&amp;', '&')
-        # Remove trailing separators
-        url = url.rstrip('?&')
-        
-        return url.strip()
+        return clean_url(url)
     
     def _make_urls_clickable(self, text: str) -> str:
         """
@@ -193,67 +227,373 @@ class NewsReportGenerator:
             story (list): List of flowable objects for the PDF.
             content (str): The content to add.
         """
-        # Clean the entire content first
-        content = self._clean_text(content)
+        story.extend(self._iter_content_flowables(content))
+    
+    def _iter_content_flowables(self, content: str):
+        """
+        Process the content and yield its PDF flowables one at a time.
         
-        # Split content into paragraphs
-        paragraphs = content.split('\n\n')
+        Args:
+            content (str): The content to render.
+            
+        Yields:
+            Flowable: Paragraphs and spacers for the content.
+        """
+        yield from self._iter_block_flowables(parse_blocks(content))
+    
+    def _iter_block_flowables(self, blocks):
+        """
+        Yield the PDF flowables for parsed report blocks.
         
-        for para in paragraphs:
-            para = para.strip()
-            if not para:
-                continue
+        Args:
+            blocks (list): Blocks from parse_blocks.
             
+        Yields:
+            Flowable: Paragraphs and spacers for the blocks.
+        """
+        for block in blocks:
             # Make URLs clickable (this also escapes HTML)
-            para_processed = self._make_urls_clickable(para)
+            text_processed = self._make_urls_clickable(block['text'])
             
-            # Check if it's a heading (starts with # or is all caps and short)
-            if para.startswith('#'):
-                # Remove markdown heading symbols
-                heading_text = para.lstrip('#').strip()
-                heading_processed = self._make_urls_clickable(heading_text)
-                p = Paragraph(f"<b>{heading_processed}</b>", self.styles['NewsHeading'])
-                story.append(p)
-            elif para.startswith('**') and para.endswith('**'):
-                # Bold text as heading
-                heading_text = para.strip('*').strip()
-                heading_processed = self._make_urls_clickable(heading_text)
-                p = Paragraph(f"<b>{heading_processed}</b>", self.styles['NewsHeading'])
-                story.append(p)
-            elif len(para) < 100 and para.isupper():
-                # All caps short text as heading
-                p = Paragraph(para_processed, self.styles['NewsHeading'])
-                story.append(p)
+            if block['type'] == 'heading':
+                yield Paragraph(f"<b>{text_processed}</b>", self.styles['NewsHeading'])
             else:
                 # Regular paragraph with clickable URLs
-                p = Paragraph(para_processed, self.styles['CustomBody'])
-                story.append(p)
+                yield Paragraph(text_processed, self.styles['CustomBody'])
             
-            story.append(Spacer(1, 0.1 * inch))
+            yield Spacer(1, 0.1 * inch)
+
+    def generate_digest(self, report_paths, output_path: str = None, title: str = None) -> str:
+        """
+        Generate a single digest PDF from several stored reports.
+        
+        Reports are streamed one block at a time: items are deduplicated and
+        rendered as they are read, and flowables are laid out on the page as
+        soon as they are produced, so neither the report text nor the story
+        is held in memory. Memory still grows slowly with the number of days:
+        the canvas keeps every finished page until the PDF is saved, and one
+        hash per seen headline and source URL is kept for deduplication.
+        
+        Args:
+            report_paths (list): Paths of the stored report text files.
+            output_path (str): Optional custom output path.
+            title (str): Optional digest title.
+            
+        Returns:
+            str: Path to the generated PDF file.
+        """
+        self.filename = output_path or Config.DIGEST_FILENAME
+        
+        # Order by report date up front; only paths are held, never contents
+        ordered_paths = sorted(report_paths, key=lambda path: (_report_date(path), str(path)))
+        if not ordered_paths:
+            raise ValueError("No stored reports found for the digest")
+        
+        doc = BaseDocTemplate(
+            self.filename,
+            pagesize=letter,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=18,
+        )
+        frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='normal')
+        doc.addPageTemplates([PageTemplate(id='Digest', frames=frame, pagesize=letter)])
+        
+        first_date = _report_date(ordered_paths[0]).strftime("%B %d, %Y")
+        last_date = _report_date(ordered_paths[-1]).strftime("%B %d, %Y")
+        header = [
+            Paragraph(title or Config.DIGEST_TITLE, self.styles['CustomTitle']),
+            Paragraph(f"{first_date} - {last_date}", self.styles['CustomSubtitle']),
+            Spacer(1, 0.3 * inch),
+        ]
+        
+        flowables = itertools.chain(header, self._iter_digest_flowables(ordered_paths))
+        doc.build(_LazyStory(flowables))
+        
+        return self.filename
+    
+    def _iter_digest_flowables(self, report_paths):
+        """
+        Yield the flowables for every unique item of the given reports.
+        
+        Args:
+            report_paths (list): Report paths, already in date order.
+            
+        Yields:
+            Flowable: Day headings, summaries and news items.
+        """
+        current_date = None
+        item_number = 0
+        
+        for report_date, kind, lines in self._iter_digest_blocks(report_paths):
+            if report_date != current_date:
+                current_date = report_date
+                yield Paragraph(report_date.strftime("%A, %B %d, %Y"), self.styles['CustomSubtitle'])
+            
+            if kind == 'item':
+                item_number += 1
+                headline = ITEM_HEADER_PATTERN.sub('', lines[0]).strip(' *#')
+                headline_processed = self._make_urls_clickable(self._clean_text(headline))
+                yield Paragraph(
+                    f"<b>{item_number}. {headline_processed}</b>",
+                    self.styles['NewsHeading']
+                )
+                lines = lines[1:]
+            
+            yield from self._iter_content_flowables('\n\n'.join(lines))
+    
+    def _iter_digest_blocks(self, report_paths):
+        """
+        Stream report blocks in date order, dropping repeated news items.
+        
+        Items are considered duplicates when their source URL or their
+        headline was already seen in an earlier report. Only hashes of those
+        keys are kept.
+        
+        Args:
+            report_paths (list): Report paths, already in date order.
+            
+        Yields:
+            tuple: ``(report_date, kind, lines)`` for each kept block.
+        """
+        seen = set()
+        
+        for path in report_paths:
+            report_date = _report_date(path)
+            for kind, lines in self._iter_report_blocks(path):
+                if kind == 'item':
+                    keys = self._item_keys(lines)
+                    if seen.intersection(keys):
+                        continue
+                    seen.update(keys)
+                yield report_date, kind, lines
+    
+    def _iter_report_blocks(self, path):
+        """
+        Read a stored report line by line and yield its blocks.
+        
+        A block ends at a ``---`` separator or where the next ``NEWS ITEM``
+        header starts.
+        
+        Args:
+            path (str): Path to the report text file.
+            
+        Yields:
+            tuple: ``(kind, lines)`` where kind is ``'item'`` or ``'summary'``.
+        """
+        lines = []
+        
+        def flush():
+            kind = 'item' if ITEM_HEADER_PATTERN.match(lines[0]) else 'summary'
+            return kind, list(lines)
+        
+        with open(path, encoding='utf-8') as report_file:
+            for line in report_file:
+                line = line.strip()
+                if _SEPARATOR_PATTERN.match(line):
+                    if lines:
+                        yield flush()
+                        lines.clear()
+                    continue
+                if ITEM_HEADER_PATTERN.match(line) and lines:
+                    yield flush()
+                    lines.clear()
+                if line or lines:
+                    lines.append(line)
+        
+        if lines:
+            yield flush()
+    
+    def _item_keys(self, lines) -> set:
+        """
+        Build the deduplication keys for a news item.
+        
+        Args:
+            lines (list): Lines of the news item block.
+            
+        Returns:
+            set: Hashes of the normalised headline and source URL.
+        """
+        headline = ITEM_HEADER_PATTERN.sub('', lines[0])
+        keys = {hash(('headline', ' '.join(re.findall(r'[a-z0-9]+', headline.lower()))))}
+        
+        for line in lines[1:]:
+            match = re.search(r'https?://[^\s<>"]+', line)
+            if match and re.match(r'[*\s]*source', line, re.IGNORECASE):
+                url = self._clean_url(match.group(0)).rstrip('/').lower()
+                keys.add(hash(('source', url)))
+                break
+        
+        return keys
+
+
+class _LazyStory(list):
+    """
+    Story list that pulls its flowables from an iterator on demand.
+    
+    ``doc.build`` checks ``len()`` before handling the next flowable, so the
+    list is only topped up there: with the next flowable, plus the ones it
+    has to be kept with. Flowables already laid out are removed by the
+    build itself, so only the current look-ahead is held in memory.
+    """
+    
+    def __init__(self, flowables):
+        """
+        Initialize the story.
+        
+        Args:
+            flowables (iterable): Flowables in document order.
+        """
+        super().__init__()
+        self._flowables = iter(flowables)
+    
+    def __len__(self):
+        """Top up the look-ahead and return the number of buffered flowables."""
+        while self._flowables is not None and (
+            not list.__len__(self) or list.__getitem__(self, -1).getKeepWithNext()
+        ):
+            flowable = next(self._flowables, None)
+            if flowable is None:
+                self._flowables = None
+            else:
+                self.append(flowable)
+        return list.__len__(self)
+    
+    def __getitem__(self, index):
+        """Get buffered flowables, topping up the look-ahead first."""
+        len(self)
+        return list.__getitem__(self, index)
+
+
+_SEPARATOR_PATTERN = re.compile(r'^-{3,}$')
+_DATE_IN_NAME_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+
+def _report_date(path):
+    """
+    Get the date of a stored report.
+    
+    Uses a ``YYYY-MM-DD`` stamp in the file name, falling back to the
+    file's modification time.
+    
+    Args:
+        path (str): Path to the report text file.
+        
+    Returns:
+        date: The report date.
+    """
+    match = _DATE_IN_NAME_PATTERN.search(Path(path).name)
+    if match:
+        try:
+            return date(*(int(part) for part in match.groups()))
+        except ValueError:
+            pass
+    return datetime.fromtimestamp(Path(path).stat().st_mtime).date()
+
+
+def find_stored_reports(reports_dir: str, days: int) -> list:
+    """
+    Find the stored reports from the last ``days`` days.
+    
+    Args:
+        reports_dir (str): Directory holding the report text files.
+        days (int): Size of the digest window, including today.
+        
+    Returns:
+        list: Paths of the matching reports.
+    """
+    first_day = date.today() - timedelta(days=days - 1)
+    return [
+        path for path in Path(reports_dir).glob('*.txt')
+        if _report_date(path) >= first_day
+    ]
+
+
+def store_report(content: str, reports_dir: str = None, suffix: str = "") -> str:
+    """
+    Store a copy of a daily report where the digest can find it.
+    
+    Args:
+        content (str): The news content generated by the agent.
+        reports_dir (str): Optional directory, defaults to Config.REPORTS_DIR.
+        suffix (str): Optional suffix keeping several reports of a day apart.
+        
+    Returns:
+        str: Path of the stored report.
+    """
+    path = Path(reports_dir or Config.REPORTS_DIR) / f"news_content_{date.today():%Y-%m-%d}{suffix}.txt"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+    return str(path)
 
 if __name__ == "__main__":
     import argparse
     import sys
-    from pathlib import Path
     
     parser = argparse.ArgumentParser(description="AI News Agent - PDF Generation")
-    parser.add_argument("--input", required=True, help="Path to the input text file with news content")
+    parser.add_argument("--input", help="Path to the input text file with news content")
     parser.add_argument("--output", help="Path to save the generated PDF")
+    parser.add_argument(
+        "--formats",
+        default="pdf",
+        help="Comma-separated output formats: pdf, md, html, json, discord (Discord embed payloads)"
+    )
+    parser.add_argument(
+        "--reports-dir",
+        help="Also store a dated copy of the input here, for the digest command"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    
+    digest_parser = subparsers.add_parser(
+        "digest",
+        help="Compile the stored reports of the last days into one digest PDF"
+    )
+    digest_parser.add_argument(
+        "--input-dir",
+        default=Config.REPORTS_DIR,
+        help="Directory with the stored report text files (YYYY-MM-DD in the name)"
+    )
+    digest_parser.add_argument(
+        "--days",
+        type=int,
+        default=7,
+        help="Number of days to include, e.g. 7 for weekly or 31 for monthly"
+    )
+    digest_parser.add_argument("--title", help="Title of the digest")
+    digest_parser.add_argument("--output", dest="digest_output", help="Path to save the digest PDF")
     args = parser.parse_args()
     
+    if args.command is None and not args.input:
+        parser.error("--input is required")
+    if args.command == "digest" and (args.input or args.output or args.reports_dir):
+        parser.error("--input, --output and --reports-dir do not apply to digest; use digest --output")
+    
     try:
-        # Read content
-        input_path = Path(args.input)
-        if not input_path.exists():
-            raise FileNotFoundError(f"Input file not found: {input_path}")
+        if args.command == "digest":
+            report_paths = find_stored_reports(args.input_dir, args.days)
+            generator = NewsReportGenerator()
+            pdf_path = generator.generate_digest(report_paths, args.digest_output, args.title)
             
-        content = input_path.read_text(encoding='utf-8')
-        
-        # Generate PDF
-        generator = NewsReportGenerator(filename=args.output)
-        pdf_path = generator.generate_report(content, args.output)
-        
-        print(f"✅ PDF generated successfully: {pdf_path}")
+            print(f"✅ Digest of {len(report_paths)} reports generated successfully: {pdf_path}")
+        else:
+            # Read content
+            input_path = Path(args.input)
+            if not input_path.exists():
+                raise FileNotFoundError(f"Input file not found: {input_path}")
+                
+            content = input_path.read_text(encoding='utf-8')
+            
+            # Render every requested format from a single parse
+            formats = tuple(name.strip() for name in args.formats.split(",") if name.strip())
+            generator = NewsReportGenerator(filename=args.output)
+            outputs = generator.render_report(content, args.output, formats)
+            
+            for output_format, output_path in outputs.items():
+                print(f"✅ {output_format.upper()} generated successfully: {output_path}")
+            
+            if args.reports_dir:
+                print(f"🗄️  Report stored for digests: {store_report(content, args.reports_dir)}")
         
     except Exception as e:
         print(f"❌ Error: {str(e)}")
@@ -0,0 +1,485 @@
+"""
+Report parsing and text renderers for the AI News Agent.
+Parses the agent's report once and renders it as Markdown, HTML, JSON and
+Discord embed payloads. Only uses the standard library, so delivery steps
+can use it without installing reportlab.
+"""
+import html
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from config import Config
+
+
+# Discord limits, see https://discord.com/developers/docs/resources/message#embed-object-embed-limits
+EMBED_TITLE_LIMIT = 256
+EMBED_DESCRIPTION_LIMIT = 4096
+EMBED_FIELD_NAME_LIMIT = 256
+EMBED_FIELD_VALUE_LIMIT = 1024
+EMBED_FIELDS_PER_EMBED = 25
+EMBED_TOTAL_LIMIT = 6000
+EMBEDS_PER_MESSAGE = 10
+EMBED_COLOR = 0x2563EB
+
+URL_PATTERN = re.compile(r'(https?://[^\s<>"]+)')
+ITEM_HEADER_PATTERN = re.compile(r'^[#*\s]*NEWS ITEM\s*\d*\s*[:.\-]?\s*', re.IGNORECASE)
+FIELD_PATTERN = re.compile(r'^[*\s]*(Source|Significance)[*\s]*:[*\s]*(.*)$', re.IGNORECASE)
+
+
+def clean_text(text: str) -> str:
+    """
+    Clean text by removing excessive quotes and formatting artifacts.
+
+    Args:
+        text (str): Text to clean.
+
+    Returns:
+        str: Cleaned text.
+    """
+    # Remove excessive double quotes around phrases
+    # But keep quotes that are part of actual quotes
+    text = re.sub(r'""([^"]+)""', r'\1', text)  # Remove double-double quotes
+    text = re.sub(r'"([A-Z][^"]{10,})"', r'\1', text)  # Remove quotes around capitalized phrases
+
+    return text
+
+
+def clean_url(url: str) -> str:
+    """
+    Clean URL by removing tracking parameters and fixing encoding.
+
+    Args:
+        url (str): URL to clean.
+
+    Returns:
+        str: Cleaned URL.
+    """
+    # Remove tracking parameters
+    url = re.sub(r'[?&](utm_[^&]*|ref=[^&]*|fbclid=[^&]*)', '', url)
+    # Fix HTML encoding
+    url = url.replace('&amp;', '&')
+    # Remove trailing separators
+    url = url.rstrip('?&')
+
+    return url.strip()
+
+
+def parse_blocks(content: str) -> list:
+    """
+    Split report content into heading and paragraph blocks.
+
+    Args:
+        content (str): The news content generated by the agent.
+
+    Returns:
+        list: Blocks with a type (``heading`` or ``paragraph``) and text.
+    """
+    blocks = []
+    for para in clean_text(content).split('\n\n'):
+        para = para.strip()
+        if not para:
+            continue
+
+        # Headings start with #, are wrapped in ** or are short all-caps lines
+        if para.startswith('#'):
+            blocks.append({"type": "heading", "text": para.lstrip('#').strip()})
+        elif para.startswith('**') and para.endswith('**'):
+            blocks.append({"type": "heading", "text": para.strip('*').strip()})
+        elif len(para) < 100 and para.isupper():
+            blocks.append({"type": "heading", "text": para})
+        else:
+            blocks.append({"type": "paragraph", "text": para})
+
+    return blocks
+
+
+def parse_report(content: str, title: str = None) -> dict:
+    """
+    Parse the agent's report into the structure every renderer uses.
+
+    ``blocks`` keeps the paragraph-level layout (what the PDF shows) and
+    ``sections`` groups it into the executive summary and news items, with
+    their source and significance split out.
+
+    Args:
+        content (str): The news content generated by the agent.
+        title (str): Optional report title, defaults to Config.REPORT_TITLE.
+
+    Returns:
+        dict: The parsed report with title, date, blocks and sections.
+    """
+    blocks = parse_blocks(content)
+    return {
+        "title": title or Config.REPORT_TITLE,
+        "date": datetime.now().strftime("%B %d, %Y"),
+        "blocks": blocks,
+        "sections": _group_sections(blocks),
+    }
+
+
+def _group_sections(blocks: list) -> list:
+    """
+    Group parsed blocks into titled sections.
+
+    A section starts at a heading block or at a paragraph whose first line
+    is a ``NEWS ITEM`` header or a short all-caps title, as in the agent's
+    ``EXECUTIVE SUMMARY`` written right above its text; ``---`` separators
+    are dropped.
+
+    Args:
+        blocks (list): Blocks from parse_report.
+
+    Returns:
+        list: Sections with kind, title, body, source and significance.
+    """
+    sections = []
+    current = None
+
+    def start(title):
+        kind = 'item' if ITEM_HEADER_PATTERN.match(title) else 'section'
+        title = ITEM_HEADER_PATTERN.sub('', title).strip(' *#') if kind == 'item' else title
+        section = {"kind": kind, "title": title, "body": [], "source": None, "significance": None}
+        sections.append(section)
+        return section
+
+    for block in blocks:
+        lines = [line.strip() for line in block["text"].split('\n') if line.strip()]
+        if block["type"] == "heading":
+            current = start(' '.join(lines))
+            continue
+
+        if ITEM_HEADER_PATTERN.match(lines[0]) or (len(lines) > 1 and _is_title_line(lines[0])):
+            current = start(lines[0])
+            lines = lines[1:]
+        elif current is None:
+            current = start('')
+
+        for line in lines:
+            if re.fullmatch(r'-{3,}', line):
+                continue
+            match = FIELD_PATTERN.match(line)
+            if match:
+                field, value = match.group(1).lower(), match.group(2).strip()
+                if field == 'source':
+                    url = URL_PATTERN.search(value)
+                    value = clean_url(url.group(1)) if url else value
+                current[field] = value
+            else:
+                current["body"].append(line)
+
+    for section in sections:
+        section["body"] = '\n'.join(section["body"])
+    return [section for section in sections if section["title"] or section["body"]]
+
+
+def _is_title_line(line: str) -> bool:
+    """Check whether a line is a short all-caps title such as EXECUTIVE SUMMARY."""
+    return len(line) < 100 and line.isupper() and len(re.sub(r'[^A-Z]', '', line)) > 3
+
+
+def render_markdown(report: dict) -> str:
+    """
+    Render a parsed report as Markdown.
+
+    Args:
+        report (dict): Report from parse_report.
+
+    Returns:
+        str: Markdown document.
+    """
+    lines = [f"# {report['title']}", "", f"_{report['date']}_", ""]
+
+    for section in report["sections"]:
+        if section["title"]:
+            lines += [f"## {section['title']}", ""]
+        if section["body"]:
+            lines += [section["body"].replace('\n', '  \n'), ""]
+        if section["source"]:
+            lines += [f"**Source:** {_markdown_link(section['source'])}", ""]
+        if section["significance"]:
+            lines += [f"**Significance:** {section['significance']}", ""]
+
+    return '\n'.join(lines)
+
+
+def render_html(report: dict) -> str:
+    """
+    Render a parsed report as a standalone HTML page.
+
+    Args:
+        report (dict): Report from parse_report.
+
+    Returns:
+        str: HTML document.
+    """
+    parts = [
+        "<!DOCTYPE html>",
+        '<html lang="en">',
+        "<head>",
+        '<meta charset="utf-8">',
+        f"<title>{html.escape(report['title'])}</title>",
+        "<style>body{font-family:Helvetica,Arial,sans-serif;max-width:760px;margin:2em auto;"
+        "color:#1a1a1a;line-height:1.5}h1{text-align:center}.date{text-align:center;color:#666}"
+        "h2{color:#2563eb;font-size:1.15em}</style>",
+        "</head>",
+        "<body>",
+        f"<h1>{html.escape(report['title'])}</h1>",
+        f'<p class="date">{html.escape(report["date"])}</p>',
+    ]
+
+    for block in report["blocks"]:
+        text = _html_with_links(block["text"]).replace('\n', '<br>\n')
+        if block["type"] == "heading":
+            parts.append(f"<h2>{text}</h2>")
+        else:
+            parts.append(f"<p>{text}</p>")
+
+    parts += ["</body>", "</html>", ""]
+    return '\n'.join(parts)
+
+
+def render_json(report: dict) -> str:
+    """
+    Render a parsed report as JSON.
+
+    Args:
+        report (dict): Report from parse_report.
+
+    Returns:
+        str: JSON document.
+    """
+    return json.dumps(report, ensure_ascii=False, indent=2)
+
+
+def render_discord_payloads(report: dict) -> list:
+    """
+    Render a parsed report as Discord webhook payloads with embeds.
+
+    Every payload stays within Discord's limits: at most 10 embeds and
+    6000 characters per message, and the per-embed title, description and
+    field limits. Long texts continue in extra embeds.
+
+    Args:
+        report (dict): Report from parse_report.
+
+    Returns:
+        list: JSON-serializable webhook payloads, in sending order.
+    """
+    embeds = []
+    for section in report["sections"]:
+        fields = []
+        if section["significance"]:
+            fields += _chunk_field("Significance", section["significance"])
+        if section["source"]:
+            fields += _chunk_field("Source", section["source"])
+
+        url = section["source"] if section["source"] and URL_PATTERN.fullmatch(section["source"]) else None
+        embeds += _build_embeds(section["title"] or report["title"], section["body"], fields, url)
+
+    payloads = []
+    current, size = [], 0
+    for embed in embeds:
+        embed_size = _embed_size(embed)
+        if current and (len(current) == EMBEDS_PER_MESSAGE or size + embed_size > EMBED_TOTAL_LIMIT):
+            payloads.append({"embeds": current})
+            current, size = [], 0
+        current.append(embed)
+        size += embed_size
+    if current:
+        payloads.append({"embeds": current})
+
+    if payloads:
+        payloads[0]["content"] = f"📰 **{report['title']}** - {report['date']}"
+    return payloads
+
+
+def _build_embeds(title: str, description: str, fields: list, url: str = None) -> list:
+    """
+    Build one section's embeds, continuing in new embeds when limits are hit.
+
+    Args:
+        title (str): Section title.
+        description (str): Section body.
+        fields (list): Embed fields, each within the field limits.
+        url (str): Optional link for the first embed's title.
+
+    Returns:
+        list: Embeds for the section.
+    """
+    title = _truncate(title, EMBED_TITLE_LIMIT)
+    continued_title = _truncate(f"{title} (cont.)", EMBED_TITLE_LIMIT)
+
+    embeds = []
+    for index, chunk in enumerate(_chunk_text(description, EMBED_DESCRIPTION_LIMIT) or ['']):
+        embed = {"title": title if index == 0 else continued_title, "color": EMBED_COLOR}
+        if chunk:
+            embed["description"] = chunk
+        if url and index == 0:
+            embed["url"] = url
+        embeds.append(embed)
+
+    for field in fields:
+        embed = embeds[-1]
+        embed_fields = embed.setdefault("fields", [])
+        if (len(embed_fields) == EMBED_FIELDS_PER_EMBED
+                or _embed_size(embed) + len(field["name"]) + len(field["value"]) > EMBED_TOTAL_LIMIT):
+            embed = {"title": continued_title, "color": EMBED_COLOR, "fields": []}
+            embeds.append(embed)
+            embed_fields = embed["fields"]
+        embed_fields.append(field)
+
+    for embed in embeds:
+        if not embed.get("fields"):
+            embed.pop("fields", None)
+    return embeds
+
+
+def _chunk_field(name: str, value: str) -> list:
+    """Split a long field value into several fields within the limits."""
+    chunks = _chunk_text(value, EMBED_FIELD_VALUE_LIMIT)
+    return [
+        {"name": _truncate(name if index == 0 else f"{name} (cont.)", EMBED_FIELD_NAME_LIMIT),
+         "value": chunk,
+         "inline": False}
+        for index, chunk in enumerate(chunks)
+    ]
+
+
+def _chunk_text(text: str, limit: int) -> list:
+    """
+    Split text into chunks of at most ``limit`` characters.
+
+    Splits at line breaks, then at spaces, and only cuts words that are
+    longer than the limit on their own.
+    """
+    chunks = []
+    text = (text or '').strip()
+    while len(text) > limit:
+        cut = text.rfind('\n', 0, limit + 1)
+        if cut <= 0:
+            cut = text.rfind(' ', 0, limit + 1)
+        if cut <= 0:
+            cut = limit
+        chunks.append(text[:cut].rstrip())
+        text = text[cut:].lstrip()
+    if text:
+        chunks.append(text)
+    return chunks
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text to ``limit`` characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit - 1].rstrip() + '…'
+
+
+def _embed_size(embed: dict) -> int:
+    """Count the characters Discord counts towards the 6000 limit."""
+    size = len(embed.get("title", "")) + len(embed.get("description", ""))
+    for field in embed.get("fields", []):
+        size += len(field["name"]) + len(field["value"])
+    return size
+
+
+def _markdown_link(text: str) -> str:
+    """Wrap a bare URL in angle brackets so Markdown renders it as a link."""
+    return f"<{text}>" if URL_PATTERN.fullmatch(text) else text
+
+
+def _html_with_links(text: str) -> str:
+    """Escape text for HTML and turn URLs into cleaned links."""
+    def make_link(match):
+        url = html.escape(clean_url(html.unescape(match.group(1))))
+        return f'<a href="{url}">{url}</a>'
+
+    return URL_PATTERN.sub(make_link, html.escape(text))
+
+
+RENDERERS = {
+    "md": render_markdown,
+    "html": render_html,
+    "json": render_json,
+    "discord": lambda report: json.dumps(render_discord_payloads(report), ensure_ascii=False, indent=2),
+}
+
+FILE_EXTENSIONS = {
+    "md": ".md",
+    "html": ".html",
+    "json": ".json",
+    "discord": ".discord.json",
+}
+
+
+def base_path(output_path: str) -> Path:
+    """
+    Get the path the output files of a report are named after.
+
+    Args:
+        output_path (str): Path of the report PDF (or any base name).
+
+    Returns:
+        Path: The path without its ``.pdf`` extension; other dots are kept.
+    """
+    path = Path(output_path)
+    return path.with_suffix('') if path.suffix.lower() == '.pdf' else path
+
+
+def write_formats(report: dict, output_path: str, formats) -> dict:
+    """
+    Write the text formats of a parsed report next to each other.
+
+    Args:
+        report (dict): Report from parse_report.
+        output_path (str): Path of the report PDF (or any base name); each
+            format gets its extension appended to the base name.
+        formats (iterable): Any of the RENDERERS keys.
+
+    Returns:
+        dict: Path of the written file for each format.
+    """
+    unknown = set(formats) - set(RENDERERS)
+    if unknown:
+        raise ValueError(f"Unknown output formats: {', '.join(sorted(unknown))}")
+
+    base = base_path(output_path)
+    base.parent.mkdir(parents=True, exist_ok=True)
+    outputs = {}
+    for output_format in formats:
+        path = base.with_name(base.name + FILE_EXTENSIONS[output_format])
+        path.write_text(RENDERERS[output_format](report), encoding='utf-8')
+        outputs[output_format] = str(path)
+    return outputs
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="AI News Agent - Text and Discord Embed Rendering")
+    parser.add_argument("--input", required=True, help="Path to the input text file with news content")
+    parser.add_argument(
+        "--output",
+        default=Config.REPORT_FILENAME,
+        help="Base name of the generated files (a .pdf extension is dropped)"
+    )
+    parser.add_argument(
+        "--formats",
+        default="discord",
+        help="Comma-separated output formats: md, html, json, discord (Discord embed payloads)"
+    )
+    args = parser.parse_args()
+
+    try:
+        input_path = Path(args.input)
+        if not input_path.exists():
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+
+        formats = [name.strip() for name in args.formats.split(",") if name.strip()]
+        report = parse_report(input_path.read_text(encoding='utf-8'))
+
+        for output_format, path in write_formats(report, args.output, formats).items():
+            print(f"✅ {output_format.upper()} generated successfully: {path}")
+
+    except Exception as e:
+        print(f"❌ Error: {str(e)}")
+        sys.exit(1)
@@ -0,0 +1,16 @@
+"""
+Run IDs for the AI News Agent.
+Shared by the agent and the worker queue without importing the agent.
+"""
+import uuid
+from datetime import datetime
+
+
+def new_run_id() -> str:
+    """
+    Generate a unique, sortable ID for a research run.
+
+    Returns:
+        str: Run ID such as ``20251223-070000-1a2b3c``.
+    """
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
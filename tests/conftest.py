@@ -0,0 +1,69 @@
+"""
+Shared pytest setup: the modules live at the repository root, and agent
+tests run against a scripted chat model instead of Gemini.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest  # noqa: E402
+from langchain_core.language_models.chat_models import BaseChatModel  # noqa: E402
+from langchain_core.outputs import ChatGeneration, ChatResult  # noqa: E402
+from langchain_core.tools import tool  # noqa: E402
+
+import agent as agent_module  # noqa: E402
+from config import Config  # noqa: E402
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Chat model replaying scripted replies; an Exception entry is raised."""
+
+    script: list
+    prompts: list
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.prompts.append(messages[0].content)
+        reply = self.script.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return ChatResult(generations=[ChatGeneration(message=reply)])
+
+
+@pytest.fixture
+def searches():
+    """Queries received by the fake search tool."""
+    return []
+
+
+@pytest.fixture
+def make_agent(monkeypatch, tmp_path, searches):
+    """Build AINewsAgents whose model replays the given replies."""
+    @tool
+    def search_web(query: str) -> str:
+        """Search the web."""
+        searches.append(query)
+        return f"results for {query}"
+
+    script = []
+    prompts = []
+    monkeypatch.setattr(Config, "FALLBACK_MODEL_NAMES", [])
+    monkeypatch.setattr(Config, "MODEL_STATS_FILE", str(tmp_path / "stats.jsonl"))
+    monkeypatch.setattr(agent_module, "get_all_tools", lambda freshness_filter=None: [search_web])
+    monkeypatch.setattr(
+        agent_module.AINewsAgent, "_initialize_model",
+        lambda self, model_name=None: ScriptedChatModel(script=script, prompts=prompts)
+    )
+
+    def make(replies):
+        script[:] = replies
+        return agent_module.AINewsAgent(checkpoint_path=str(tmp_path / "checkpoints.sqlite"))
+
+    return make
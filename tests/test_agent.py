@@ -0,0 +1,44 @@
+"""
+Tests for checkpointed research runs of the AINewsAgent.
+"""
+import pytest
+from langchain_core.messages import AIMessage
+
+
+
+def _search_call(call_id):
+    return AIMessage(content="", tool_calls=[{"name": "search_web", "args": {"query": call_id}, "id": call_id}])
+
+
+def test_resume_only_repeats_the_failed_step(make_agent, searches):
+    news_agent = make_agent([
+        _search_call("first"),
+        _search_call("second"),
+        RuntimeError("model unavailable"),
+    ])
+
+    with pytest.raises(RuntimeError):
+        news_agent.research_and_generate_report(run_id="run-1")
+    assert searches == ["first", "second"]
+
+    news_agent.model.script.append(AIMessage(content="EXECUTIVE SUMMARY\nResumed report."))
+    report = news_agent.research_and_generate_report(run_id="run-1", resume=True)
+
+    assert report == "EXECUTIVE SUMMARY\nResumed report."
+    assert searches == ["first", "second"]
+
+
+def test_resume_of_completed_run_reuses_its_result(make_agent, searches):
+    news_agent = make_agent([_search_call("only"), AIMessage(content="Finished report.")])
+    assert news_agent.research_and_generate_report(run_id="run-2") == "Finished report."
+
+    assert news_agent.research_and_generate_report(run_id="run-2", resume=True) == "Finished report."
+    assert searches == ["only"]
+
+
+def test_automatic_resume_skips_completed_runs(make_agent):
+    news_agent = make_agent([AIMessage(content="Old report."), AIMessage(content="New report.")])
+    news_agent.research_and_generate_report(run_id="done")
+
+    assert news_agent.research_and_generate_report(resume=True) == "New report."
+    assert news_agent.run_id != "done"
@@ -0,0 +1,103 @@
+"""
+Tests for the pooled SMTP EmailSender against a local aiosmtpd server.
+"""
+import socket
+
+import pytest
+from aiosmtpd.controller import Controller
+
+import email_sender
+from email_sender import EmailSender
+
+
+class RecordingHandler:
+    """SMTP handler recording each transaction, with scripted refusals."""
+
+    def __init__(self):
+        self.transactions = []
+        self.refused_once = set()
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.startswith("busy") and address not in self.refused_once:
+            self.refused_once.add(address)
+            return "451 4.3.0 Try again later"
+        if address.startswith("unknown"):
+            return "550 5.1.1 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.transactions.append((list(envelope.rcpt_tos), envelope.content))
+        return "250 Message accepted"
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=_free_port())
+    controller.start()
+    yield controller, handler
+    controller.stop()
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / "ai_news_report.pdf"
+    path.write_bytes(b"%PDF-1.4\n" + b"0" * 5000 + b"\n%%EOF\n")
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(email_sender.time, "sleep", lambda seconds: None)
+
+
+def _sender(controller, recipients, **options):
+    return EmailSender(
+        recipients=recipients,
+        sender="news@example.com",
+        host=controller.hostname,
+        port=controller.port,
+        username="",
+        use_tls=False,
+        **options,
+    )
+
+
+def test_recipients_are_sent_in_batches(smtp_server, pdf_path):
+    controller, handler = smtp_server
+    recipients = [f"reader{index}@example.com" for index in range(7)]
+
+    sent = _sender(controller, recipients, batch_size=3, max_connections=2).send_report(pdf_path)
+
+    assert sent
+    assert sorted(len(rcpt_tos) for rcpt_tos, _ in handler.transactions) == [1, 3, 3]
+    delivered = [address for rcpt_tos, _ in handler.transactions for address in rcpt_tos]
+    assert sorted(delivered) == sorted(recipients)
+    assert all(b"ai_news_report.pdf" in content for _, content in handler.transactions)
+
+
+def test_temporary_refusal_is_retried(smtp_server, pdf_path):
+    controller, handler = smtp_server
+
+    sent = _sender(controller, ["reader@example.com", "busy@example.com"]).send_report(pdf_path)
+
+    assert sent
+    delivered = [address for rcpt_tos, _ in handler.transactions for address in rcpt_tos]
+    assert sorted(delivered) == ["busy@example.com", "reader@example.com"]
+
+
+def test_permanent_refusal_is_reported(smtp_server, pdf_path, capsys):
+    controller, handler = smtp_server
+
+    sent = _sender(controller, ["reader@example.com", "unknown@example.com"]).send_report(pdf_path)
+
+    assert not sent
+    assert [rcpt_tos for rcpt_tos, _ in handler.transactions] == [["reader@example.com"]]
+    assert "unknown@example.com: 550" in capsys.readouterr().out
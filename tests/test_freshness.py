@@ -0,0 +1,34 @@
+"""
+Tests for the search result freshness filter.
+"""
+from datetime import date, datetime
+
+from freshness import FreshnessFilter, extract_published_date
+
+
+NOW = datetime(2026, 10, 18, 9, 0)
+
+
+def test_old_metadata_and_url_dates_are_dropped():
+    results = [
+        {"url": "https://example.com/news", "published_date": "2026-10-01T08:00:00", "content": ""},
+        {"url": "https://example.com/2026/10/02/story", "content": ""},
+        {"url": "https://example.com/2026/10/18/story", "content": ""},
+    ]
+
+    kept = FreshnessFilter(window_hours=24).filter(results, now=NOW)
+
+    assert [result["url"] for result in kept] == ["https://example.com/2026/10/18/story"]
+
+
+def test_snippet_dates_only_mark_results_fresh():
+    freshness = FreshnessFilter(window_hours=24)
+    background = {"url": "https://example.com/a", "content": "On May 1, 2024 the company was founded."}
+    recent = {"url": "https://example.com/b", "content": "Announced 3 hours ago at the launch event."}
+
+    kept = freshness.filter([background, recent], now=NOW)
+
+    assert extract_published_date(background, NOW) == date(2024, 5, 1)
+    assert kept == [background, recent]
+    assert freshness.counts["dropped"] == 0
+    assert freshness.counts["undated"] == 1
@@ -0,0 +1,127 @@
+"""
+Tests for deadlines, hedged requests and model fallback.
+"""
+import json
+import threading
+import time
+from dataclasses import dataclass, field, replace
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from hedging import HedgedModelMiddleware, HedgingStats
+
+
+@dataclass
+class FakeModel:
+    model: str
+    delays: list = field(default_factory=list)
+    error: Exception = None
+    reply: str = "report"
+
+
+@dataclass
+class FakeRequest:
+    model: FakeModel
+    model_settings: dict = field(default_factory=dict)
+
+    def override(self, **overrides):
+        return replace(self, **overrides)
+
+
+class Handler:
+    """Answers after the model's next delay, recording every call."""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        with self._lock:
+            self.calls.append((request.model.model, request.model_settings.get("timeout")))
+            delay = request.model.delays.pop(0) if request.model.delays else 0
+        time.sleep(delay)
+        if request.model.error:
+            raise request.model.error
+        if not request.model.reply:
+            return AIMessage(content="")
+        return AIMessage(content=f"{request.model.reply} from {request.model.model}")
+
+
+def test_slow_primary_is_won_by_the_hedge():
+    middleware = HedgedModelMiddleware(timeout=5.0, hedge_after=0.1)
+    handler = Handler()
+
+    response = middleware.wrap_model_call(FakeRequest(FakeModel("primary", delays=[2.0, 0.0])), handler)
+
+    assert response.content == "report from primary"
+    assert [model for model, _ in handler.calls] == ["primary", "primary"]
+    summary = middleware.stats.summary()
+    assert summary["hedges"] == 1
+    assert summary["hedge_wins"] == 1
+    assert summary["fallbacks"] == 0
+
+
+def test_timeout_falls_back_to_the_next_model():
+    middleware = HedgedModelMiddleware([FakeModel("fallback")], timeout=0.3, hedge_after=0.1)
+    handler = Handler()
+
+    response = middleware.wrap_model_call(FakeRequest(FakeModel("primary", delays=[1.0, 1.0])), handler)
+
+    assert response.content == "report from fallback"
+    summary = middleware.stats.summary()
+    assert summary["timeouts"] == 1
+    assert summary["fallbacks"] == 1
+    assert summary["calls"] == 1
+
+
+def test_client_timeout_is_capped_at_the_deadline():
+    middleware = HedgedModelMiddleware(timeout=3.0, hedge_after=0.2)
+    handler = Handler()
+
+    middleware.wrap_model_call(FakeRequest(FakeModel("primary", delays=[0.5, 0.5])), handler)
+
+    (_, first_timeout), (_, hedge_timeout) = handler.calls
+    assert first_timeout <= 3.0
+    assert hedge_timeout <= 2.8
+
+
+def test_error_in_every_model_is_raised():
+    middleware = HedgedModelMiddleware(
+        [FakeModel("fallback", error=ValueError("fallback down"))], timeout=1.0, hedge_after=0.5
+    )
+
+    with pytest.raises(ValueError, match="fallback down"):
+        middleware.wrap_model_call(
+            FakeRequest(FakeModel("primary", error=RuntimeError("primary down"))), Handler()
+        )
+    assert middleware.stats.summary()["failures"] == 1
+
+
+def test_empty_response_falls_back():
+    middleware = HedgedModelMiddleware([FakeModel("fallback")], timeout=1.0, hedge_after=0.5)
+
+    response = middleware.wrap_model_call(FakeRequest(FakeModel("primary", reply="")), Handler())
+
+    assert response.content == "report from fallback"
+
+
+def test_stats_rates_and_save(tmp_path, capsys):
+    stats = HedgingStats()
+    for latency in (1.0, 2.0, 3.0, 4.0):
+        stats.record("calls", latency=latency)
+    stats.record("hedges")
+    stats.record("hedges")
+    stats.record("fallbacks")
+
+    summary = stats.summary()
+    assert summary["hedge_rate"] == 0.5
+    assert summary["fallback_rate"] == 0.25
+    assert summary["p50_seconds"] == 3.0
+    assert summary["p95_seconds"] == 4.0
+
+    stats.reset()
+    saved = stats.save(str(tmp_path / "stats.jsonl"), run_id="run-1")
+    assert saved["p95_seconds"] is None
+    assert "p95: n/a" in capsys.readouterr().out
+    assert json.loads((tmp_path / "stats.jsonl").read_text())["run_id"] == "run-1"
@@ -0,0 +1,79 @@
+"""
+Tests for the streaming digest of pdf_generator.
+"""
+from datetime import date, timedelta
+
+from pdf_generator import NewsReportGenerator, _LazyStory, find_stored_reports, store_report
+
+
+REPORT = """EXECUTIVE SUMMARY
+Summary of {day}.
+
+---
+
+NEWS ITEM 1: Shared headline
+Repeated every day.
+Source: https://example.com/shared?utm_source=feed
+Significance: Shows that duplicates are dropped.
+
+---
+
+NEWS ITEM 2: Story of {day}
+{body}
+Source: https://example.com/{day}
+Significance: Only reported once.
+"""
+
+
+def _write_reports(reports_dir, days=3, body="Fresh news."):
+    for offset in range(days):
+        day = date.today() - timedelta(days=offset)
+        path = reports_dir / f"news_content_{day:%Y-%m-%d}.txt"
+        path.write_text(REPORT.format(day=day, body=body), encoding="utf-8")
+
+
+def test_digest_builds_pdf_and_drops_duplicate_items(tmp_path):
+    _write_reports(tmp_path)
+    generator = NewsReportGenerator()
+    report_paths = find_stored_reports(tmp_path, days=7)
+
+    blocks = list(generator._iter_digest_blocks(sorted(report_paths)))
+    headlines = [lines[0] for _, kind, lines in blocks if kind == "item"]
+    assert headlines.count("NEWS ITEM 1: Shared headline") == 1
+    assert len(headlines) == 4
+
+    pdf_path = generator.generate_digest(report_paths, str(tmp_path / "digest.pdf"))
+    assert (tmp_path / "digest.pdf").read_bytes().startswith(b"%PDF")
+    assert pdf_path == str(tmp_path / "digest.pdf")
+
+
+def test_digest_spans_pages(tmp_path):
+    _write_reports(tmp_path, days=10, body="Long paragraph. " * 400)
+    generator = NewsReportGenerator()
+
+    generator.generate_digest(find_stored_reports(tmp_path, days=10), str(tmp_path / "digest.pdf"))
+
+    assert (tmp_path / "digest.pdf").read_bytes().count(b"/Type /Page\n") > 10
+
+
+def test_lazy_story_only_buffers_look_ahead(tmp_path):
+    generator = NewsReportGenerator()
+    consumed = []
+
+    def flowables():
+        for index in range(100):
+            consumed.append(index)
+            yield from generator._iter_content_flowables(f"Paragraph {index}")
+
+    story = _LazyStory(flowables())
+    assert len(story) == 1
+    del story[0]
+    assert len(story) == 1
+    assert len(consumed) == 1
+
+
+def test_store_report_uses_dated_name(tmp_path):
+    path = store_report("content", str(tmp_path), suffix="_run1")
+
+    assert path.endswith(f"news_content_{date.today():%Y-%m-%d}_run1.txt")
+    assert find_stored_reports(tmp_path, days=1) != []
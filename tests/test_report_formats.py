@@ -0,0 +1,77 @@
+"""
+Tests for rendering a report once into several formats.
+"""
+import json
+
+from pdf_generator import NewsReportGenerator
+from report_formats import (
+    EMBED_DESCRIPTION_LIMIT, EMBED_FIELD_VALUE_LIMIT, EMBED_TOTAL_LIMIT, EMBEDS_PER_MESSAGE,
+    parse_report, render_discord_payloads
+)
+
+
+CONTENT = """EXECUTIVE SUMMARY
+A busy day for AI.
+
+---
+
+NEWS ITEM 1: Model launch
+{body}
+Source: https://example.com/launch?utm_source=feed
+Significance: {significance}
+"""
+
+
+def _embed_size(embed):
+    fields = embed.get("fields", [])
+    return (
+        len(embed.get("title", "")) + len(embed.get("description", ""))
+        + sum(len(field["name"]) + len(field["value"]) for field in fields)
+    )
+
+
+def test_render_report_keeps_output_path(tmp_path):
+    generator = NewsReportGenerator()
+    content = CONTENT.format(body="Short.", significance="Big.")
+
+    outputs = generator.render_report(content, str(tmp_path / "my.report.v2.pdf"), ("md", "discord", "pdf"))
+
+    assert outputs == {
+        "md": str(tmp_path / "my.report.v2.md"),
+        "discord": str(tmp_path / "my.report.v2.discord.json"),
+        "pdf": str(tmp_path / "my.report.v2.pdf"),
+    }
+    assert (tmp_path / "my.report.v2.pdf").read_bytes().startswith(b"%PDF")
+
+    outputs = generator.render_report(content, str(tmp_path / "noext"), ("html", "pdf"))
+
+    assert outputs == {"html": str(tmp_path / "noext.html"), "pdf": str(tmp_path / "noext")}
+    assert (tmp_path / "noext").read_bytes().startswith(b"%PDF")
+
+
+def test_discord_payloads_stay_within_limits():
+    content = CONTENT.format(body="word " * 6000, significance="reason " * 500)
+
+    payloads = render_discord_payloads(parse_report(content))
+
+    assert len(payloads) > 1
+    for payload in payloads:
+        assert len(payload["embeds"]) <= EMBEDS_PER_MESSAGE
+        assert sum(_embed_size(embed) for embed in payload["embeds"]) <= EMBED_TOTAL_LIMIT
+        for embed in payload["embeds"]:
+            assert len(embed.get("description", "")) <= EMBED_DESCRIPTION_LIMIT
+            assert all(len(field["value"]) <= EMBED_FIELD_VALUE_LIMIT for field in embed.get("fields", []))
+    assert json.dumps(payloads)
+
+
+def test_summary_title_directly_above_its_text():
+    report = parse_report(CONTENT.format(body="Short.", significance="Big."))
+
+    summary, item = report["sections"]
+    assert summary["title"] == "EXECUTIVE SUMMARY"
+    assert summary["body"] == "A busy day for AI."
+    assert item["title"] == "Model launch"
+
+    first_embed = render_discord_payloads(report)[0]["embeds"][0]
+    assert first_embed["title"] == "EXECUTIVE SUMMARY"
+    assert not first_embed["description"].startswith("EXECUTIVE SUMMARY")
@@ -0,0 +1,72 @@
+"""
+Tests for the freshness-filtered Tavily search tool.
+"""
+from datetime import datetime, timedelta
+
+import tools
+from freshness import FreshnessFilter
+from tools import NewsTavilySearchAPIWrapper, create_search_tool
+
+
+class StubWrapper(NewsTavilySearchAPIWrapper):
+    """News wrapper returning canned raw results instead of calling Tavily."""
+
+    response: dict
+
+    def raw_results(self, query: str, *args, **kwargs) -> dict:
+        return self.response
+
+
+def _result(url, published=None, content="News."):
+    result = {"url": url, "title": url, "content": content, "score": 0.9}
+    if published:
+        result["published_date"] = published
+    return result
+
+
+def test_search_requests_news_results(monkeypatch):
+    calls = []
+
+    class FakeClient:
+        def __init__(self, api_key):
+            pass
+
+        def search(self, query, **params):
+            calls.append((query, params))
+            return {"results": []}
+
+    monkeypatch.setattr(tools, "TavilyClient", FakeClient)
+    monkeypatch.setattr(tools.Config, "TAVILY_API_KEY", "test-key")
+
+    tool = create_search_tool()
+    tool.api_wrapper.raw_results("ai news", 10, "advanced", [], [], True, False, False)
+
+    assert calls == [("ai news", {
+        "topic": "news",
+        "days": 1,
+        "max_results": 10,
+        "search_depth": "advanced",
+        "include_domains": None,
+        "exclude_domains": None,
+        "include_answer": True,
+        "include_raw_content": False,
+        "include_images": False,
+    })]
+
+
+def test_run_drops_results_with_old_published_date(monkeypatch):
+    monkeypatch.setattr(tools.Config, "TAVILY_API_KEY", "test-key")
+    now = datetime.now()
+    fresh = _result("https://example.com/fresh", published=(now - timedelta(hours=2)).isoformat())
+    stale = _result("https://example.com/stale", published=(now - timedelta(days=5)).isoformat())
+    undated = _result("https://example.com/undated")
+    freshness = FreshnessFilter(window_hours=24)
+
+    tool = create_search_tool(freshness)
+    tool.api_wrapper = StubWrapper(tavily_api_key="test-key", response={"results": [fresh, stale, undated]})
+    results, raw_results = tool._run("ai news")
+
+    assert [result["url"] for result in results] == ["https://example.com/fresh", "https://example.com/undated"]
+    assert raw_results["results"] == [fresh, undated]
+    assert freshness.counts["dropped"] == 1
+
@@ -0,0 +1,160 @@
+"""
+Tests for the SQLite job queue of the worker daemon.
+"""
+import socket
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from contextlib import closing
+from datetime import datetime
+
+import pytest
+from langchain_core.messages import AIMessage
+
+import worker
+from config import Config
+from worker import JobQueue, WorkerDaemon, daemon_id
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(str(tmp_path / "jobs.sqlite"))
+
+
+def _set(queue, job_id, **columns):
+    assignments = ", ".join(f"{name} = ?" for name in columns)
+    with closing(queue._connect()) as connection:
+        connection.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*columns.values(), job_id))
+
+
+def test_report_jobs_get_unique_run_ids(queue):
+    first = queue.get(queue.enqueue("report"))
+    second = queue.get(queue.enqueue("report"))
+
+    assert first["payload"]["run_id"] != second["payload"]["run_id"]
+    assert queue.get(queue.enqueue("report", {"run_id": "given"}))["payload"]["run_id"] == "given"
+
+
+def test_claim_records_owner(queue):
+    queue.enqueue("send", {"file": "report.pdf"})
+    owner = daemon_id()
+
+    job = queue.claim(owner)
+
+    assert queue.get(job["id"])["owner"] == owner
+    assert queue.get(job["id"])["heartbeat_at"]
+    assert queue.claim(owner) is None
+
+
+def test_requeue_keeps_jobs_of_live_daemons(queue):
+    sleeper = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        live_owner = f"{socket.gethostname()}:{sleeper.pid}:abcd1234"
+        live_job = queue.enqueue("send", {"file": "a.pdf"})
+        queue.claim(live_owner)
+
+        dead = subprocess.Popen([sys.executable, "-c", "pass"])
+        dead.wait()
+        dead_job = queue.enqueue("send", {"file": "b.pdf"})
+        queue.claim(f"{socket.gethostname()}:{dead.pid}:abcd1234")
+
+        stale_job = queue.enqueue("send", {"file": "c.pdf"})
+        queue.claim("other-host:1:abcd1234")
+        _set(queue, stale_job, heartbeat_at="2000-01-01T00:00:00")
+
+        assert queue.requeue_interrupted(daemon_id()) == (2, 0)
+        assert queue.get(live_job)["status"] == "running"
+        assert queue.get(dead_job)["status"] == "queued"
+        assert queue.get(stale_job)["status"] == "queued"
+    finally:
+        sleeper.kill()
+        sleeper.wait()
+
+
+def test_old_queue_is_migrated(tmp_path):
+    db_path = tmp_path / "jobs.sqlite"
+    with closing(sqlite3.connect(str(db_path))) as connection:
+        connection.execute(
+            "CREATE TABLE jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, "
+            "payload TEXT NOT NULL, status TEXT NOT NULL DEFAULT 'queued', "
+            "attempts INTEGER NOT NULL DEFAULT 0, result TEXT, error TEXT, "
+            "created_at TEXT NOT NULL, started_at TEXT, finished_at TEXT)"
+        )
+        connection.commit()
+
+    queue = JobQueue(str(db_path))
+    queue.enqueue("send", {"file": "a.pdf"})
+
+    assert queue.claim(daemon_id())["kind"] == "send"
+
+
+def test_job_interrupted_too_often_fails(queue):
+    job_id = queue.enqueue("send", {"file": "a.pdf"})
+    for attempt in range(3):
+        queue.claim("other-host:1:abcd1234")
+        _set(queue, job_id, heartbeat_at="2000-01-01T00:00:00")
+        expected = (1, 0) if attempt < 2 else (0, 1)
+        assert queue.requeue_interrupted(daemon_id(), max_attempts=3) == expected
+
+    job = queue.get(job_id)
+    assert job["status"] == "failed"
+    assert "3 attempt" in job["error"]
+
+
+def test_heartbeat_continues_until_jobs_finish(queue, monkeypatch):
+    monkeypatch.setattr(Config, "WORKER_HEARTBEAT_SECONDS", 0.05)
+    started = threading.Event()
+    release = threading.Event()
+
+    class SlowWorker:
+        def warm_up(self):
+            pass
+
+        def handle(self, job):
+            started.set()
+            release.wait(5)
+            return {}
+
+    monkeypatch.setattr(worker, "ReportWorker", SlowWorker)
+    daemon = WorkerDaemon(queue, workers=1, poll_interval=0.01)
+    job_id = queue.enqueue("send", {"file": "a.pdf"})
+    server = threading.Thread(target=daemon.serve)
+    server.start()
+    try:
+        assert started.wait(5)
+        daemon.stop()
+        _set(queue, job_id, heartbeat_at="2000-01-01T00:00:00")
+        time.sleep(0.3)
+        assert queue.get(job_id)["heartbeat_at"] > "2000-01-01T00:00:00"
+    finally:
+        release.set()
+        server.join(5)
+    assert queue.get(job_id)["status"] == "done"
+
+
+def test_warm_worker_dates_each_report(make_agent, monkeypatch, tmp_path, queue):
+    import agent as agent_module
+
+    class Clock(datetime):
+        current = None
+
+        @classmethod
+        def now(cls, tz=None):
+            return cls.current
+
+    news_agent = make_agent([AIMessage(content="Monday report."), AIMessage(content="Wednesday report.")])
+    monkeypatch.setattr(agent_module, "datetime", Clock)
+    monkeypatch.setattr(Config, "REPORTS_DIR", str(tmp_path / "reports"))
+    report_worker = worker.ReportWorker()
+    report_worker._agent = news_agent
+
+    for day in (datetime(2026, 10, 19, 7), datetime(2026, 10, 21, 7)):
+        Clock.current = day
+        queue.enqueue("report", {"send": False})
+        report_worker.handle(queue.claim(daemon_id()))
+
+    first, second = news_agent.model.prompts
+    assert "Today's date is October 19, 2026." in first
+    assert "Today's date is October 21, 2026." in second
@@ -1,25 +1,119 @@
 """
 Custom tools for the AI News Agent.
 """
+from typing import Optional
 from langchain_community.tools.tavily_search import TavilySearchResults
+from langchain_community.utilities.tavily_search import TavilySearchAPIWrapper
+from tavily import AsyncTavilyClient, TavilyClient
 from config import Config
+from freshness import FreshnessFilter
 
 
-def create_search_tool():
+class NewsTavilySearchAPIWrapper(TavilySearchAPIWrapper):
+    """
+    Tavily API wrapper that can search the news topic.
+    
+    The stock wrapper always runs general searches, which come without a
+    ``published_date``; news searches return it, so the freshness filter
+    can use the publication date instead of guessing from URLs and snippets.
+    """
+    
+    topic: str = "news"
+    days: Optional[int] = None
+    
+    def raw_results(self, query: str, *args, **kwargs) -> dict:
+        """Run the search through the Tavily client, with topic and days."""
+        client = TavilyClient(api_key=self.tavily_api_key.get_secret_value())
+        return client.search(query, **self._search_params(*args, **kwargs))
+    
+    async def raw_results_async(self, query: str, *args, **kwargs) -> dict:
+        """Run the search asynchronously, with topic and days."""
+        client = AsyncTavilyClient(api_key=self.tavily_api_key.get_secret_value())
+        return await client.search(query, **self._search_params(*args, **kwargs))
+    
+    def _search_params(
+        self,
+        max_results: Optional[int] = 5,
+        search_depth: Optional[str] = "advanced",
+        include_domains: Optional[list] = None,
+        exclude_domains: Optional[list] = None,
+        include_answer: Optional[bool] = False,
+        include_raw_content: Optional[bool] = False,
+        include_images: Optional[bool] = False,
+    ) -> dict:
+        """
+        Build the Tavily search parameters from the stock wrapper's arguments.
+        
+        Returns:
+            dict: Keyword arguments for ``TavilyClient.search``.
+        """
+        return {
+            "topic": self.topic,
+            "days": self.days,
+            "max_results": max_results,
+            "search_depth": search_depth,
+            "include_domains": include_domains or None,
+            "exclude_domains": exclude_domains or None,
+            "include_answer": include_answer,
+            "include_raw_content": include_raw_content,
+            "include_images": include_images,
+        }
+
+
+class FreshTavilySearchResults(TavilySearchResults):
+    """Tavily search tool that drops results published outside the freshness window."""
+    
+    freshness_filter: Optional[FreshnessFilter] = None
+    
+    def _run(self, query: str, run_manager=None):
+        """Run the search and filter the raw results by published date."""
+        return self._filter_results(*super()._run(query, run_manager))
+    
+    async def _arun(self, query: str, run_manager=None):
+        """Run the search asynchronously and filter the raw results by published date."""
+        return self._filter_results(*await super()._arun(query, run_manager))
+    
+    def _filter_results(self, results, raw_results: dict):
+        """
+        Apply the freshness filter before the results reach the model.
+        
+        Args:
+            results: Cleaned results, or an error message string.
+            raw_results (dict): Raw Tavily response, including published dates.
+            
+        Returns:
+            tuple: Cleaned fresh results and the filtered raw response.
+        """
+        if isinstance(results, str) or self.freshness_filter is None:
+            return results, raw_results
+        
+        fresh_results = self.freshness_filter.filter(raw_results.get("results", []))
+        return (
+            self.api_wrapper.clean_results(fresh_results),
+            {**raw_results, "results": fresh_results},
+        )
+
+
+def create_search_tool(freshness_filter: FreshnessFilter = None):
     """
     Create and configure the web search tool using Tavily.
     
+    Args:
+        freshness_filter (FreshnessFilter): Optional filter applied to the
+            results; a default one is created if omitted.
+    
     Returns:
-        TavilySearchResults: Configured search tool for the agent.
+        FreshTavilySearchResults: Configured search tool for the agent.
     """
-    search_tool = TavilySearchResults(
+    search_tool = FreshTavilySearchResults(
         max_results=10,  # More results for better selection
         search_depth="advanced",
         include_answer=True,
         include_raw_content=False,
         include_images=False,
-        days=1,  # Filter to last 24 hours only
-        api_key=Config.TAVILY_API_KEY,
+        # News results carry a published_date; last 24 hours only
+        api_wrapper=NewsTavilySearchAPIWrapper(tavily_api_key=Config.TAVILY_API_KEY, topic="news", days=1),
+        freshness_filter=freshness_filter or FreshnessFilter(Config.FRESHNESS_WINDOW_HOURS),
         name="search_web",
         description=(
             "Search the web for RECENT AI and automation news from the last 24 hours. "
@@ -31,11 +125,14 @@ def create_search_tool():
     return search_tool
 
 
-def get_all_tools():
+def get_all_tools(freshness_filter: FreshnessFilter = None):
     """
     Get all tools available for the agent.
     
+    Args:
+        freshness_filter (FreshnessFilter): Optional filter for search results.
+    
     Returns:
         list: List of tools for the agent.
     """
-    return [create_search_tool()]
+    return [create_search_tool(freshness_filter)]
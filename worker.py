@@ -0,0 +1,575 @@
+"""
+Long-lived worker daemon for the AI News Agent.
+Keeps the model, search tool, PDF styles and HTTP sessions warm and
+processes report jobs from a local SQLite-backed queue.
+"""
+import argparse
+import json
+import os
+import signal
+import socket
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from contextlib import closing
+from datetime import datetime, timedelta
+from pathlib import Path
+from config import Config
+from run_ids import new_run_id
+
+
+JOB_KINDS = ("report", "pdf", "send")
+
+
+class JobQueue:
+    """
+    Durable job queue stored in a local SQLite database.
+
+    Any process on the host can enqueue jobs; workers claim them atomically,
+    so several workers (or daemons) can share one queue. Each running job
+    records the daemon that owns it and that daemon's last heartbeat, so
+    only the jobs of a dead or unresponsive daemon are taken over.
+    """
+
+    def __init__(self, db_path: str = None):
+        """
+        Initialize the queue and create its table if needed.
+
+        Args:
+            db_path (str): Optional path of the SQLite database.
+        """
+        self.db_path = Path(db_path or Config.JOB_QUEUE_DB)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    result TEXT,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT,
+                    owner TEXT,
+                    heartbeat_at TEXT
+                )
+                """
+            )
+            # Queues created before jobs had owners
+            columns = {row["name"] for row in connection.execute("PRAGMA table_info(jobs)")}
+            for column in ("owner", "heartbeat_at"):
+                if column not in columns:
+                    connection.execute(f"ALTER TABLE jobs ADD COLUMN {column} TEXT")
+
+    def _connect(self):
+        """
+        Open a connection in autocommit mode; transactions are explicit.
+
+        Returns:
+            sqlite3.Connection: Connection returning rows as mappings.
+        """
+        connection = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def enqueue(self, kind: str, payload: dict = None) -> int:
+        """
+        Add a job to the queue.
+
+        Args:
+            kind (str): Job kind, one of JOB_KINDS.
+            payload (dict): Job arguments.
+
+        Returns:
+            int: ID of the new job.
+        """
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind: {kind}")
+
+        payload = dict(payload or {})
+        if kind == "report":
+            # Checkpoints outlive the queue, so the run ID must not reuse job IDs
+            payload.setdefault("run_id", new_run_id())
+
+        with closing(self._connect()) as connection:
+            cursor = connection.execute(
+                "INSERT INTO jobs (kind, payload, created_at) VALUES (?, ?, ?)",
+                (kind, json.dumps(payload), _now())
+            )
+            return cursor.lastrowid
+
+    def claim(self, owner: str):
+        """
+        Atomically take the oldest queued job and mark it running.
+
+        Args:
+            owner (str): ID of the claiming daemon, see daemon_id.
+
+        Returns:
+            dict: The claimed job, or None if the queue is empty.
+        """
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT * FROM jobs WHERE status = 'queued' ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                connection.execute("COMMIT")
+                return None
+            now = _now()
+            connection.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, started_at = ?, "
+                "owner = ?, heartbeat_at = ? WHERE id = ?",
+                (now, owner, now, row["id"])
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["attempts"] += 1
+        return job
+
+    def finish(self, job_id: int, result: dict = None, error: str = None):
+        """
+        Record the outcome of a job.
+
+        Args:
+            job_id (int): ID of the job.
+            result (dict): Result of a successful job.
+            error (str): Error message of a failed job.
+        """
+        status = "failed" if error else "done"
+        with closing(self._connect()) as connection:
+            connection.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?",
+                (status, json.dumps(result) if result is not None else None, error, _now(), job_id)
+            )
+
+    def heartbeat(self, owner: str):
+        """
+        Mark the running jobs of a daemon as still alive.
+
+        Args:
+            owner (str): ID of the daemon, see daemon_id.
+        """
+        with closing(self._connect()) as connection:
+            connection.execute(
+                "UPDATE jobs SET heartbeat_at = ? WHERE status = 'running' AND owner = ?",
+                (_now(), owner)
+            )
+
+    def requeue_interrupted(
+        self, owner: str = None, stale_after: float = None, max_attempts: int = None
+    ) -> tuple:
+        """
+        Put jobs left running by a dead or unresponsive daemon back in the queue.
+
+        A job is taken over when its owner is a process of this host that no
+        longer runs, or when its heartbeat is older than ``stale_after``.
+        Jobs of live daemons are left alone. A job that was already started
+        ``max_attempts`` times is marked failed instead, so a job that keeps
+        killing its daemon is not retried forever.
+
+        Args:
+            owner (str): ID of the calling daemon, whose jobs are kept.
+            stale_after (float): Seconds without a heartbeat after which a
+                job is considered abandoned.
+            max_attempts (int): Starts after which an interrupted job fails.
+
+        Returns:
+            tuple: Number of requeued jobs and number of failed jobs.
+        """
+        stale_after = stale_after or Config.WORKER_STALE_SECONDS
+        max_attempts = max_attempts or Config.WORKER_MAX_ATTEMPTS
+        cutoff = (datetime.now() - timedelta(seconds=stale_after)).isoformat(timespec="seconds")
+
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            rows = connection.execute(
+                "SELECT id, owner, heartbeat_at, attempts FROM jobs WHERE status = 'running'"
+            ).fetchall()
+            abandoned = [
+                row for row in rows
+                if row["owner"] != owner and (
+                    not row["heartbeat_at"] or row["heartbeat_at"] < cutoff or not _owner_alive(row["owner"])
+                )
+            ]
+            requeued = [(row["id"],) for row in abandoned if row["attempts"] < max_attempts]
+            failed = [
+                (f"Interrupted after {row['attempts']} attempt(s)", _now(), row["id"])
+                for row in abandoned if row["attempts"] >= max_attempts
+            ]
+            connection.executemany(
+                "UPDATE jobs SET status = 'queued', owner = NULL WHERE id = ?", requeued
+            )
+            connection.executemany(
+                "UPDATE jobs SET status = 'failed', error = ?, finished_at = ? WHERE id = ?", failed
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+
+        return len(requeued), len(failed)
+
+    def get(self, job_id: int):
+        """
+        Get a job by ID.
+
+        Args:
+            job_id (int): ID of the job.
+
+        Returns:
+            dict: The job, or None if it does not exist.
+        """
+        with closing(self._connect()) as connection:
+            row = connection.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+
+class ReportWorker:
+    """
+    A worker thread's warm clients and the job handlers that use them.
+
+    Clients are created on first use (or by warm_up) and then reused for
+    every later job handled by this worker. Their modules are imported
+    lazily too, so queue commands such as ``submit`` stay fast.
+    """
+
+    def __init__(self):
+        """Initialize the worker with no clients loaded yet."""
+        self._agent = None
+        self._pdf_generator = None
+        self._discord_sender = None
+
+    @property
+    def agent(self):
+        """AINewsAgent with its model, search tool and checkpointer."""
+        if self._agent is None:
+            from agent import AINewsAgent
+            self._agent = AINewsAgent()
+        return self._agent
+
+    @property
+    def pdf_generator(self):
+        """NewsReportGenerator with its style sheet set up."""
+        if self._pdf_generator is None:
+            from pdf_generator import NewsReportGenerator
+            self._pdf_generator = NewsReportGenerator()
+        return self._pdf_generator
+
+    @property
+    def discord_sender(self):
+        """DiscordSender holding a keep-alive HTTP session."""
+        if self._discord_sender is None:
+            import requests
+            from discord_sender import DiscordSender
+            self._discord_sender = DiscordSender(Config.DISCORD_WEBHOOK_URL, session=requests.Session())
+        return self._discord_sender
+
+    def warm_up(self):
+        """Load every client up front so the first job starts immediately."""
+        self.agent
+        self.pdf_generator
+        self.discord_sender
+
+    def handle(self, job: dict) -> dict:
+        """
+        Run a job.
+
+        Args:
+            job (dict): Claimed job from the queue.
+
+        Returns:
+            dict: Paths produced by the job.
+        """
+        handler = getattr(self, f"_handle_{job['kind']}")
+        return handler(job)
+
+    def _handle_report(self, job: dict) -> dict:
+        """
+        Research, render and (unless ``send`` is false) deliver a report.
+
+        A job that is retried after an interruption resumes its research
+        run from the last checkpoint.
+        """
+        from pdf_generator import store_report
+        from report_formats import parse_report, write_formats
+
+        payload = job["payload"]
+        send = payload.get("send", True)
+        run_id = payload["run_id"]
+        resume = job["attempts"] > 1 and self.agent.has_run(run_id)
+        content = self.agent.research_and_generate_report(run_id=run_id, resume=resume)
+
+        # Dated names so the stored reports can be rolled up into digests
+        content_path = store_report(content, suffix=f"_{run_id}")
+        output_path = payload.get("output") or str(Path(content_path).with_name(f"ai_news_report_{run_id}.pdf"))
+        result = {"content": content_path}
+
+        # The embeds only need the parsed report, so they go out before the PDF build
+        report = parse_report(content)
+        result["embeds"] = write_formats(report, output_path, ["discord"])["discord"]
+        if send:
+            result["embeds_sent"] = self._send_embeds(result["embeds"])
+
+        result["pdf"] = self.pdf_generator.build_report_pdf(report, output_path)
+        if send:
+            result["sent"] = self._send_pdf(result["pdf"])
+        return result
+
+    def _handle_pdf(self, job: dict) -> dict:
+        """Render a stored report text file to PDF, next to it by default."""
+        payload = job["payload"]
+        input_path = Path(payload["input"])
+        content = input_path.read_text(encoding="utf-8")
+        return {"pdf": self._render_pdf(content, payload.get("output") or str(input_path.with_suffix(".pdf")))}
+
+    def _handle_send(self, job: dict) -> dict:
+        """Deliver a PDF report to Discord."""
+        return {"sent": self._send_pdf(job["payload"]["file"])}
+
+    def _render_pdf(self, content: str, output_path: str) -> str:
+        """Render report content to a PDF file and return its path."""
+        return self.pdf_generator.generate_report(content, output_path)
+
+    def _send_embeds(self, embeds_path: str) -> bool:
+        """Post the Discord embed payloads; the PDF is sent even if this fails."""
+        payloads = json.loads(Path(embeds_path).read_text(encoding="utf-8"))
+        return self.discord_sender.send_embeds(payloads)
+
+    def _send_pdf(self, pdf_path: str) -> str:
+        """Deliver a PDF to Discord, raising if the delivery failed."""
+        if not self.discord_sender.send_report(pdf_path):
+            raise RuntimeError(f"Failed to send report to Discord: {pdf_path}")
+        return pdf_path
+
+
+class WorkerDaemon:
+    """Pool of warm workers consuming the local job queue."""
+
+    def __init__(self, queue: JobQueue, workers: int = None, poll_interval: float = None):
+        """
+        Initialize the daemon.
+
+        Args:
+            queue (JobQueue): Queue to consume.
+            workers (int): Number of worker threads.
+            poll_interval (float): Seconds between polls of an empty queue.
+        """
+        self.queue = queue
+        self.workers = workers or Config.WORKER_COUNT
+        self.poll_interval = poll_interval or Config.WORKER_POLL_SECONDS
+        self.owner = daemon_id()
+        self._stop = threading.Event()
+        # Heartbeats go on until the running jobs are done, not just until stop()
+        self._heartbeat_stop = threading.Event()
+
+    def serve(self):
+        """Warm up the workers and process jobs until stopped."""
+        self._requeue_interrupted()
+        heartbeat = threading.Thread(target=self._run_heartbeat, name="heartbeat", daemon=True)
+        heartbeat.start()
+
+        print(f"🔥 Warming up {self.workers} worker(s)...")
+        workers = [ReportWorker() for _ in range(self.workers)]
+        for worker in workers:
+            worker.warm_up()
+
+        threads = [
+            threading.Thread(target=self._run_worker, args=(worker,), name=f"worker-{index}")
+            for index, worker in enumerate(workers, start=1)
+        ]
+        for thread in threads:
+            thread.start()
+        print(f"✅ Worker daemon ready, queue: {self.queue.db_path.absolute()}")
+
+        for thread in threads:
+            thread.join()
+        self._heartbeat_stop.set()
+        heartbeat.join()
+        print("👋 Worker daemon stopped")
+
+    def stop(self, *_):
+        """Ask the workers to exit after their current job."""
+        if not self._stop.is_set():
+            print("🛑 Stopping after current jobs...")
+        self._stop.set()
+
+    def _requeue_interrupted(self):
+        """Take over the jobs of daemons that died or stopped heartbeating."""
+        requeued, failed = self.queue.requeue_interrupted(self.owner)
+        if requeued:
+            print(f"🔁 Requeued {requeued} interrupted job(s)")
+        if failed:
+            print(f"❌ Failed {failed} job(s) interrupted {Config.WORKER_MAX_ATTEMPTS} times")
+
+    def _run_heartbeat(self):
+        """Keep this daemon's running jobs alive and watch for abandoned ones."""
+        while not self._heartbeat_stop.wait(Config.WORKER_HEARTBEAT_SECONDS):
+            try:
+                self.queue.heartbeat(self.owner)
+                self._requeue_interrupted()
+            except sqlite3.Error as e:
+                print(f"⚠️  Heartbeat failed: {str(e)}")
+
+    def _run_worker(self, worker: ReportWorker):
+        """
+        Claim and process jobs until the daemon is stopped.
+
+        Args:
+            worker (ReportWorker): Warm worker owned by this thread.
+        """
+        name = threading.current_thread().name
+        while not self._stop.is_set():
+            job = self.queue.claim(self.owner)
+            if job is None:
+                self._stop.wait(self.poll_interval)
+                continue
+
+            print(f"📥 [{name}] Job {job['id']} ({job['kind']}) started")
+            try:
+                result = worker.handle(job)
+            except Exception as e:
+                print(f"❌ [{name}] Job {job['id']} failed: {str(e)}")
+                self.queue.finish(job["id"], error=str(e))
+            else:
+                print(f"✅ [{name}] Job {job['id']} done")
+                self.queue.finish(job["id"], result=result)
+
+
+def daemon_id() -> str:
+    """
+    Generate the ID recorded as owner of the jobs a daemon claims.
+
+    Returns:
+        str: ``host:pid:token``; the token tells a restarted daemon that
+            got the same PID (e.g. PID 1 in a container) from its predecessor.
+    """
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _owner_alive(owner: str) -> bool:
+    """
+    Check whether the daemon owning a job may still be running.
+
+    Args:
+        owner (str): Owner recorded on the job, see daemon_id; never the
+            calling daemon's own ID.
+
+    Returns:
+        bool: False if the owner is a process of this host that has exited;
+            owners on other hosts are only judged by their heartbeat.
+    """
+    parts = (owner or "").rsplit(":", 2)
+    if len(parts) != 3 or parts[0] != socket.gethostname() or not parts[1].isdigit():
+        return bool(owner)
+    pid = int(parts[1])
+    if pid == os.getpid():
+        # Same PID but another token: a previous run of this process
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _now() -> str:
+    """Get the current local time as an ISO 8601 string."""
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def main():
+    """
+    Main function to run the daemon or talk to its queue.
+    """
+    parser = argparse.ArgumentParser(description="AI News Agent - Worker Daemon")
+    parser.add_argument("--queue-db", help="Path of the SQLite job queue")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="Run the worker daemon")
+    serve_parser.add_argument("--workers", type=int, help="Number of worker threads")
+
+    submit_parser = subparsers.add_parser("submit", help="Queue a job")
+    submit_parser.add_argument("kind", choices=JOB_KINDS, help="Kind of job")
+    submit_parser.add_argument("--input", help="Report text file (pdf jobs)")
+    submit_parser.add_argument("--output", help="Path of the PDF to generate (report and pdf jobs)")
+    submit_parser.add_argument("--file", help="PDF file to deliver (send jobs)")
+    submit_parser.add_argument("--no-send", action="store_true", help="Do not deliver the report (report jobs)")
+    submit_parser.add_argument("--wait", action="store_true", help="Wait for the job to finish")
+
+    status_parser = subparsers.add_parser("status", help="Show a job")
+    status_parser.add_argument("job_id", type=int, help="ID of the job")
+    args = parser.parse_args()
+
+    queue = JobQueue(args.queue_db)
+
+    if args.command == "serve":
+        Config.validate()
+        daemon = WorkerDaemon(queue, workers=args.workers)
+        signal.signal(signal.SIGINT, daemon.stop)
+        signal.signal(signal.SIGTERM, daemon.stop)
+        daemon.serve()
+        return
+
+    if args.command == "status":
+        job = queue.get(args.job_id)
+        if job is None:
+            print(f"❌ Job not found: {args.job_id}")
+            sys.exit(1)
+        print(json.dumps(job, indent=2))
+        return
+
+    payload = {
+        key: value for key, value in {
+            "input": args.input,
+            "output": args.output,
+            "file": args.file,
+        }.items() if value
+    }
+    if args.kind == "report":
+        payload["send"] = not args.no_send
+    if args.kind == "pdf" and not args.input:
+        parser.error("--input is required for pdf jobs")
+    if args.kind == "send" and not args.file:
+        parser.error("--file is required for send jobs")
+
+    job_id = queue.enqueue(args.kind, payload)
+    print(f"📮 Queued job {job_id} ({args.kind})")
+
+    if args.wait:
+        job = queue.get(job_id)
+        while job["status"] in ("queued", "running"):
+            time.sleep(Config.WORKER_POLL_SECONDS)
+            job = queue.get(job_id)
+        print(json.dumps(job, indent=2))
+        if job["status"] != "done":
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()